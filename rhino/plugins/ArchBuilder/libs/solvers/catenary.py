@@ -16,6 +16,11 @@ from __future__ import annotations
 import math
 
 
+_cosh = math.cosh
+_isfinite = math.isfinite
+_sinh = math.sinh
+
+
 def solve_catenary_parameter(half_span: float, rise: float, tolerance: float) -> float:  # noqa: PLR0912
     """Solve for the catenary parameter 'a' in y = a(cosh(x/a) - 1).
 
@@ -40,14 +45,14 @@ def solve_catenary_parameter(half_span: float, rise: float, tolerance: float) ->
         x = half_span / a
         if x > 40.0:  # Prevent overflow
             return float("inf")
-        return a * math.cosh(x) - a - rise
+        return a * _cosh(x) - a - rise
 
     def derivative(a: float) -> float:
         """Derivative with respect to 'a'."""
         x = half_span / a
         if x > 40.0:  # Prevent overflow
             return float("inf")
-        return math.cosh(x) - x * math.sinh(x) - 1.0
+        return _cosh(x) - x * _sinh(x) - 1.0
 
     # Find bracketing interval
     a_low = max(min(half_span, rise), tolerance)
@@ -64,7 +69,7 @@ def solve_catenary_parameter(half_span: float, rise: float, tolerance: float) ->
 
     a_high = max(rise, half_span)
     f_high = equation(a_high)
-    if f_high >= 0.0 or not math.isfinite(f_high):
+    if f_high >= 0.0 or not _isfinite(f_high):
         for _ in range(64):
             a_high *= 2.0
             f_high = equation(a_high)
@@ -81,7 +86,7 @@ def solve_catenary_parameter(half_span: float, rise: float, tolerance: float) ->
             return value
 
         df = derivative(value)
-        if not math.isfinite(df) or abs(df) < 1e-9:
+        if not _isfinite(df) or abs(df) < 1e-9:
             value = 0.5 * (a_low + a_high)  # Bisection fallback
         else:
             newton = value - f_val / df
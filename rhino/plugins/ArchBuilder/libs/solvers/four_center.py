@@ -13,13 +13,17 @@ Computes the mathematical parameters needed to construct four-center arches.
 
 from __future__ import annotations
 
+import functools
 import math
-from collections.abc import Iterator, Sequence
+from collections.abc import Sequence
 
 from libs.geometry.math_utils import clamp
 from libs.geometry.parameters import FourCenterParameters
 
 
+_sqrt = math.sqrt
+
+
 _MIN_SHOULDER_RATIO = 0.05
 _MAX_SHOULDER_RATIO = 0.95
 _MIN_SHOULDER_HEIGHT_RATIO = 0.2
@@ -39,7 +43,7 @@ def _prioritized_values(
     *,
     step: float,
     extras: Sequence[float] = (),
-) -> list[float]:
+) -> tuple[float, ...]:
     """Generate candidate values ordered by proximity to the base value."""
     base_clamped = clamp(base, minimum, maximum)
     values: list[float] = []
@@ -67,43 +71,31 @@ def _prioritized_values(
     for value in ordered_grid:
         push(value)
 
-    return values
+    return tuple(values)
 
 
-def _candidate_pairs(
-    shoulder_ratios: Sequence[float],
-    shoulder_height_ratios: Sequence[float],
-) -> Iterator[tuple[float, float]]:
-    """Yield unique shoulder ratio combinations in priority order."""
+@functools.lru_cache(maxsize=64)
+def _build_candidate_pairs(
+    shoulder_ratios: tuple[float, ...],
+    shoulder_height_ratios: tuple[float, ...],
+) -> tuple[tuple[float, float], ...]:
+    """Return unique shoulder ratio combinations in priority order."""
     if not shoulder_ratios or not shoulder_height_ratios:
-        return
+        return ()
 
-    seen: set[tuple[float, float]] = set()
     base_sr = shoulder_ratios[0]
     base_sh = shoulder_height_ratios[0]
 
-    def push(sr: float, sh: float) -> Iterator[tuple[float, float]]:
-        key = (_round_key(sr), _round_key(sh))
-        if key in seen:
-            return
-        seen.add(key)
-        yield (sr, sh)
-
-    # Start with the base combination
-    yield from push(base_sr, base_sh)
-
-    # Vary shoulder ratio while keeping shoulder height fixed first
-    for sr in shoulder_ratios:
-        yield from push(sr, base_sh)
-
-    # Vary shoulder height while keeping shoulder ratio fixed
-    for sh in shoulder_height_ratios:
-        yield from push(base_sr, sh)
+    # Base combination, then vary shoulder ratio, then shoulder height, then the remaining grid
+    ordered: list[tuple[float, float]] = [(base_sr, base_sh)]
+    ordered.extend((sr, base_sh) for sr in shoulder_ratios)
+    ordered.extend((base_sr, sh) for sh in shoulder_height_ratios)
+    ordered.extend((sr, sh) for sh in shoulder_height_ratios for sr in shoulder_ratios)
 
-    # Explore the remaining grid
-    for sh in shoulder_height_ratios:
-        for sr in shoulder_ratios:
-            yield from push(sr, sh)
+    unique: dict[tuple[float, float], tuple[float, float]] = {}
+    for sr, sh in ordered:
+        unique.setdefault((_round_key(sr), _round_key(sh)), (sr, sh))
+    return tuple(unique.values())
 
 
 def _solve_with_fixed_tangent(
@@ -133,8 +125,9 @@ def _solve_with_fixed_tangent(
     if r1 <= tolerance:
         raise ValueError("Lower radius collapses for the requested proportions.")
 
-    r1_check = math.sqrt((x_t - c) ** 2 + y_t**2)
-    if abs(r1 - r1_check) > tolerance:
+    # Compare squared radii: |r1 - r| = tol corresponds to |r1^2 - r^2| ~ tol * (2*r1 + tol)
+    r1_check_sq = (x_t - c) ** 2 + y_t**2
+    if abs(r1 * r1 - r1_check_sq) > tolerance * (2.0 * r1 + tolerance):
         raise ValueError("Lower arc geometry is inconsistent with span/rise.")
 
     if abs(y_t) <= tolerance:
@@ -152,26 +145,22 @@ def _solve_with_fixed_tangent(
     if discriminant < -tolerance:
         raise ValueError("Upper arc discriminant is negative; no real solution.")
 
-    discriminant = max(0.0, discriminant)
-    sqrt_disc = math.sqrt(discriminant)
-    h2_candidates = (
-        (-b_coef + sqrt_disc) / (2.0 * a_coef),
-        (-b_coef - sqrt_disc) / (2.0 * a_coef),
-    )
+    sqrt_disc = _sqrt(max(0.0, discriminant))
+    two_a = 2.0 * a_coef
+    h2_high = (-b_coef + sqrt_disc) / two_a
+    h2_low = (-b_coef - sqrt_disc) / two_a
 
-    h2 = next(
-        (candidate for candidate in h2_candidates if candidate > y_t + tolerance and candidate < rise * 2.0),
-        None,
-    )
-    if h2 is None:
-        h2 = max(h2_candidates)
-        if h2 <= y_t + tolerance:
-            raise ValueError("Upper centre collapses toward the tangent point.")
+    # a_coef > 0, so h2_high >= h2_low; fall back to the lower root only when the upper one overshoots
+    floor = y_t + tolerance
+    ceiling = rise * 2.0
+    h2 = h2_low if h2_high >= ceiling and floor < h2_low < ceiling else h2_high
+    if h2 <= floor:
+        raise ValueError("Upper centre collapses toward the tangent point.")
 
     d = x_t - k * (y_t - h2)
 
-    r2_from_shoulder = math.sqrt((x_t - d) ** 2 + (y_t - h2) ** 2)
-    r2_from_apex = math.sqrt(d * d + (h2 - rise) ** 2)
+    r2_from_shoulder = _sqrt((x_t - d) ** 2 + (y_t - h2) ** 2)
+    r2_from_apex = _sqrt(d * d + (h2 - rise) ** 2)
     r2 = (r2_from_shoulder + r2_from_apex) * 0.5
 
     if r2 <= tolerance:
@@ -273,7 +262,7 @@ def solve_four_center_parameters(
     attempts = 0
     failure_samples: list[str] = []
 
-    for sr, sh in _candidate_pairs(shoulder_candidates, height_candidates):
+    for sr, sh in _build_candidate_pairs(shoulder_candidates, height_candidates):
         attempts += 1
         try:
             return _solve_with_fixed_tangent(span, rise, sr, sh, tolerance)
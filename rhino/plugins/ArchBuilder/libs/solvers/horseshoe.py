@@ -18,6 +18,11 @@ import math
 from libs.geometry.parameters import HorseshoeParameters
 
 
+_cos = math.cos
+_radians = math.radians
+_sin = math.sin
+
+
 def solve_horseshoe_parameters(
     half_span: float,
     rise: float,
@@ -46,24 +51,21 @@ def solve_horseshoe_parameters(
     if extension_degrees <= 180.0:
         extension_degrees = 240.0  # Default horseshoe angle
 
-    theta = math.radians(extension_degrees)
+    theta = _radians(extension_degrees)
     half_theta = theta / 2.0
 
     # Radius from span and angle: span = 2R·sin(θ/2)
-    radius = half_span / math.sin(half_theta)
+    radius = half_span / _sin(half_theta)
 
     # Center position: y = -R·cos(θ/2)
     # For θ > 180°: cos(θ/2) < 0, so center_y > 0
     center_x = 0.0
-    center_y = -radius * math.cos(half_theta)
-
-    # Angles to base points
-    angle_to_left = math.atan2(0.0 - center_y, -half_span)
-    angle_to_right = math.atan2(0.0 - center_y, half_span)
+    center_y = -radius * _cos(half_theta)
 
-    # Ensure arc > 180°
-    if angle_to_right < angle_to_left:
-        angle_to_right += 2.0 * math.pi
+    # Angles to base points: the base points sit at (±R·sin(θ/2), R·cos(θ/2)) from the center,
+    # so for 180° < θ < 360° the angles follow directly from θ/2 and the arc already spans > 180°
+    angle_to_left = half_theta - 1.5 * math.pi
+    angle_to_right = 0.5 * math.pi - half_theta
 
     return HorseshoeParameters(
         center_x=center_x,
@@ -19,6 +19,12 @@ from libs.geometry.curves import circular_segment_radius
 from libs.geometry.parameters import FoilArcParameters, MultifoilParameters
 
 
+_atan2 = math.atan2
+_cos = math.cos
+_sin = math.sin
+_sqrt = math.sqrt
+
+
 def solve_multifoil_parameters(  # noqa: PLR0915
     half_span: float,
     rise: float,
@@ -58,8 +64,8 @@ def solve_multifoil_parameters(  # noqa: PLR0915
     main_center_x = 0.0
 
     # Arc angles from left base to right base
-    angle_to_left_base = math.atan2(0.0 - main_center_y, -half_span)
-    angle_to_right_base = math.atan2(0.0 - main_center_y, half_span)
+    angle_to_left_base = _atan2(0.0 - main_center_y, -half_span)
+    angle_to_right_base = _atan2(0.0 - main_center_y, half_span)
     total_angle = angle_to_right_base - angle_to_left_base
 
     foil_arcs = []
@@ -71,8 +77,8 @@ def solve_multifoil_parameters(  # noqa: PLR0915
             start_pt_y = 0.0
         else:
             start_angle = angle_to_left_base + (total_angle * i / lobes)
-            start_pt_x = main_center_x + main_radius * math.cos(start_angle)
-            start_pt_y = main_center_y + main_radius * math.sin(start_angle)
+            start_pt_x = main_center_x + main_radius * _cos(start_angle)
+            start_pt_y = main_center_y + main_radius * _sin(start_angle)
 
         if i == lobes - 1:
             end_angle = angle_to_right_base
@@ -80,19 +86,19 @@ def solve_multifoil_parameters(  # noqa: PLR0915
             end_pt_y = 0.0
         else:
             end_angle = angle_to_left_base + (total_angle * (i + 1) / lobes)
-            end_pt_x = main_center_x + main_radius * math.cos(end_angle)
-            end_pt_y = main_center_y + main_radius * math.sin(end_angle)
+            end_pt_x = main_center_x + main_radius * _cos(end_angle)
+            end_pt_y = main_center_y + main_radius * _sin(end_angle)
 
         # Foil center positioned inside main arc to create inward cusps
         foil_center_angle = (start_angle + end_angle) / 2
         # Position foil center inside the main arc based on lobe_size
         # lobe_size controls how deep the cusps go inward
         foil_center_distance = main_radius * (1.0 - lobe_size * 0.3)  # 0.7 to 1.0 of main radius
-        foil_center_x = main_center_x + foil_center_distance * math.cos(foil_center_angle)
-        foil_center_y = main_center_y + foil_center_distance * math.sin(foil_center_angle)
+        foil_center_x = main_center_x + foil_center_distance * _cos(foil_center_angle)
+        foil_center_y = main_center_y + foil_center_distance * _sin(foil_center_angle)
 
         # Calculate radius to reach the cusp points on the main arc
-        foil_radius = math.sqrt((start_pt_x - foil_center_x) ** 2 + (start_pt_y - foil_center_y) ** 2)
+        foil_radius = _sqrt((start_pt_x - foil_center_x) ** 2 + (start_pt_y - foil_center_y) ** 2)
         # The radius should be the actual distance to the cusp points for proper geometry
 
         # Angles from foil center to cusp points
@@ -101,8 +107,8 @@ def solve_multifoil_parameters(  # noqa: PLR0915
         vec_end_x = end_pt_x - foil_center_x
         vec_end_y = end_pt_y - foil_center_y
 
-        angle_start = math.atan2(vec_start_y, vec_start_x)
-        angle_end = math.atan2(vec_end_y, vec_end_x)
+        angle_start = _atan2(vec_start_y, vec_start_x)
+        angle_end = _atan2(vec_end_y, vec_end_x)
 
         # Ensure inward-curving arc by using the minor positive sweep
         angle_diff = angle_end - angle_start
@@ -18,6 +18,9 @@ import math
 from libs.geometry.parameters import OgeeParameters
 
 
+_sqrt = math.sqrt
+
+
 def solve_ogee_parameters(  # noqa: PLR0912, PLR0915
     half_span: float,
     rise: float,
@@ -70,22 +73,22 @@ def solve_ogee_parameters(  # noqa: PLR0912, PLR0915
     perp_dy = chord_dx
 
     # Normalize perpendicular direction
-    perp_length = math.sqrt(perp_dx * perp_dx + perp_dy * perp_dy)
+    perp_length = _sqrt(perp_dx * perp_dx + perp_dy * perp_dy)
     if perp_length <= tolerance:
         raise ValueError("Inflection point too close to base.")
     perp_dx /= perp_length
     perp_dy /= perp_length
 
-    chord_length = math.sqrt(chord_dx * chord_dx + chord_dy * chord_dy)
+    chord_length = _sqrt(chord_dx * chord_dx + chord_dy * chord_dy)
 
     # Radius based on geometric mean of span and rise
-    geometric_scale = math.sqrt(half_span * rise)
+    geometric_scale = _sqrt(half_span * rise)
     radius_multiplier = 2.0 - curve_strength  # [1.9, 1.1] -> gentler to tighter curve
     desired_radius = geometric_scale * radius_multiplier
 
     # Find position on perpendicular bisector: r² = (chord/2)² + t²
     t_squared = desired_radius * desired_radius - (chord_length * 0.5) ** 2
-    t = chord_length * 0.2 if t_squared < 0 else math.sqrt(t_squared)  # Fallback if radius too small
+    t = chord_length * 0.2 if t_squared < 0 else _sqrt(t_squared)  # Fallback if radius too small
 
     # Place center for convex arc (center right of curve)
     if perp_dx > 0:
@@ -95,7 +98,7 @@ def solve_ogee_parameters(  # noqa: PLR0912, PLR0915
         cx_lower = mid_x - perp_dx * t  # Flip direction
         cy_lower = mid_y - perp_dy * t
 
-    lower_radius = math.sqrt((cx_lower + half_span) ** 2 + cy_lower**2)
+    lower_radius = _sqrt((cx_lower + half_span) ** 2 + cy_lower**2)
 
     # Step 2: Tangent at inflection (perpendicular to radius)
     radius_dx = -inflection_x - cx_lower
@@ -104,7 +107,7 @@ def solve_ogee_parameters(  # noqa: PLR0912, PLR0915
     tangent_dy = radius_dx
 
     # Normalize tangent direction
-    tangent_length = math.sqrt(tangent_dx * tangent_dx + tangent_dy * tangent_dy)
+    tangent_length = _sqrt(tangent_dx * tangent_dx + tangent_dy * tangent_dy)
     if tangent_length <= tolerance:
         raise ValueError("Invalid tangent calculation at inflection.")
     tangent_dx /= tangent_length
@@ -137,7 +140,7 @@ def solve_ogee_parameters(  # noqa: PLR0912, PLR0915
     upper_radius = abs(t_upper)
 
     # Verify apex distance matches
-    r_to_apex = math.sqrt(cx_upper * cx_upper + (rise - cy_upper) ** 2)
+    r_to_apex = _sqrt(cx_upper * cx_upper + (rise - cy_upper) ** 2)
     if abs(upper_radius - r_to_apex) > tolerance:
         upper_radius = (upper_radius + r_to_apex) / 2.0  # Average if discrepancy
 
@@ -155,8 +158,8 @@ def solve_ogee_parameters(  # noqa: PLR0912, PLR0915
     cross_product = abs(v_lower_x * v_upper_y - v_lower_y * v_upper_x)
     dot_product = v_lower_x * v_upper_x + v_lower_y * v_upper_y
 
-    v_lower_mag = math.sqrt(v_lower_x * v_lower_x + v_lower_y * v_lower_y)
-    v_upper_mag = math.sqrt(v_upper_x * v_upper_x + v_upper_y * v_upper_y)
+    v_lower_mag = _sqrt(v_lower_x * v_lower_x + v_lower_y * v_lower_y)
+    v_upper_mag = _sqrt(v_upper_x * v_upper_x + v_upper_y * v_upper_y)
 
     if v_lower_mag > tolerance and v_upper_mag > tolerance:
         normalized_cross = cross_product / (v_lower_mag * v_upper_mag)
@@ -19,6 +19,11 @@ from libs.geometry.math_utils import clamp
 from libs.geometry.parameters import ThreeCenterParameters
 
 
+_copysign = math.copysign
+_isfinite = math.isfinite
+_sqrt = math.sqrt
+
+
 def solve_three_center_parameters(  # noqa: PLR0912, PLR0915
     span: float,
     rise: float,
@@ -51,23 +56,23 @@ def solve_three_center_parameters(  # noqa: PLR0912, PLR0915
 
     def slope_difference(y_t: float) -> float:
         if y_t <= tolerance or y_t >= rise - tolerance:
-            return math.copysign(math.inf, y_t - (rise * 0.5))
+            return _copysign(math.inf, y_t - (rise * 0.5))
 
         numerator = x_t * x_t + y_t * y_t - rise * rise
         denominator = 2.0 * (y_t - rise)
         if abs(denominator) <= tolerance:
-            return math.copysign(math.inf, denominator)
+            return _copysign(math.inf, denominator)
         c1 = numerator / denominator
         if c1 >= 0.0:
-            return math.copysign(math.inf, c1 + tolerance)
+            return _copysign(math.inf, c1 + tolerance)
 
         denom_d = 2.0 * (half_span - x_t)
         if abs(denom_d) <= tolerance:
-            return math.copysign(math.inf, denom_d)
+            return _copysign(math.inf, denom_d)
         d = (half_span * half_span - x_t * x_t - y_t * y_t) / denom_d
         if not (0.0 < d < half_span):
             direction = -1.0 if d <= 0.0 else 1.0
-            return math.copysign(math.inf, direction)
+            return _copysign(math.inf, direction)
 
         slope_central = x_t / (y_t - c1)
         slope_side = (x_t - d) / y_t
@@ -80,15 +85,15 @@ def solve_three_center_parameters(  # noqa: PLR0912, PLR0915
     prev_y = y_min
     prev_val = slope_difference(prev_y)
     root_interval: tuple[float, float] | None = None
-    best_y, best_val = prev_y, abs(prev_val) if math.isfinite(prev_val) else math.inf
+    best_y, best_val = prev_y, abs(prev_val) if _isfinite(prev_val) else math.inf
 
     for i in range(1, samples + 1):
         y = y_min + (y_max - y_min) * (i / samples)
         val = slope_difference(y)
-        if math.isfinite(prev_val) and math.isfinite(val) and prev_val * val <= 0:
+        if _isfinite(prev_val) and _isfinite(val) and prev_val * val <= 0:
             root_interval = (prev_y, y)
             break
-        if math.isfinite(val) and abs(val) < best_val:
+        if _isfinite(val) and abs(val) < best_val:
             best_y, best_val = y, abs(val)
         prev_y, prev_val = y, val
 
@@ -105,7 +110,7 @@ def solve_three_center_parameters(  # noqa: PLR0912, PLR0915
             for i in range(1, samples_expanded + 1):
                 y = y_min_expanded + (y_max_expanded - y_min_expanded) * (i / samples_expanded)
                 val = slope_difference(y)
-                if math.isfinite(val) and abs(val) < best_val:
+                if _isfinite(val) and abs(val) < best_val:
                     best_y, best_val = y, abs(val)
 
             # Accept expanded search result if reasonable
@@ -125,14 +130,14 @@ def solve_three_center_parameters(  # noqa: PLR0912, PLR0915
         f_high = slope_difference(high)
 
         # Ensure we have valid bounds
-        if not (math.isfinite(f_low) and math.isfinite(f_high)):
+        if not (_isfinite(f_low) and _isfinite(f_high)):
             y_t = best_y  # Fallback to best approximation
         else:
             y_t = 0.5 * (low + high)
             for _ in range(64):
                 mid = 0.5 * (low + high)
                 f_mid = slope_difference(mid)
-                if not math.isfinite(f_mid):
+                if not _isfinite(f_mid):
                     break
                 if abs(f_mid) <= tolerance:
                     y_t = mid
@@ -169,12 +174,12 @@ def solve_three_center_parameters(  # noqa: PLR0912, PLR0915
 
     # Verify that computed radii are consistent
     # Side arc should pass through both base and tangent point
-    side_radius_check = math.sqrt((x_t - d) ** 2 + y_t**2)
+    side_radius_check = _sqrt((x_t - d) ** 2 + y_t**2)
     if abs(side_radius - side_radius_check) > tolerance:
         raise ValueError(f"Side arc geometry inconsistent: radius mismatch {abs(side_radius - side_radius_check)}")
 
     # Central arc should pass through tangent point and apex
-    central_radius_from_tangent = math.sqrt(x_t**2 + (y_t - c1) ** 2)
+    central_radius_from_tangent = _sqrt(x_t**2 + (y_t - c1) ** 2)
     if abs(central_radius - central_radius_from_tangent) > tolerance:
         raise ValueError(
             f"Central arc geometry inconsistent: radius mismatch {abs(central_radius - central_radius_from_tangent)}"
@@ -24,20 +24,22 @@ from libs.exceptions import DetailError, UserCancelledError
 import Rhino
 
 
-def get_active_detail_id() -> object | None:
+def get_active_detail() -> Rhino.DocObjects.DetailViewObject | None:
     """
-    Detects and returns the ID of the currently active Detail View, if any.
+    Detects and returns the currently active Detail View object, if any.
+
+    The object comes straight from the page's detail list, so callers can use it
+    without re-validating its ID.
 
     Returns:
-        guid or None: The ID of the active Detail View, or None if not found.
+        DetailViewObject or None: The active Detail View, or None if not found.
     """
     pageview = sc.doc.Views.ActiveView
     if isinstance(pageview, Rhino.Display.RhinoPageView):
-        details = pageview.GetDetailViews()
         active_vp_id = pageview.ActiveViewportID
-        for detail in details:
+        for detail in pageview.GetDetailViews():
             if detail.Viewport.Id == active_vp_id:
-                return detail.Id
+                return detail
     return None
 
 
@@ -48,8 +50,16 @@ def filter_selected_objects() -> list[Any]:
     Returns:
         list: List of selected object IDs.
     """
-    selected_ids = rs.SelectedObjects() or []
-    return [obj_id for obj_id in selected_ids if not rs.IsDetail(obj_id, False) and rs.IsObjectSelectable(obj_id)]
+    objects = sc.doc.Objects
+    detail_type = Rhino.DocObjects.DetailViewObject
+    filtered = []
+    for obj_id in rs.SelectedObjects() or []:
+        rh_obj = objects.Find(obj_id)
+        if rh_obj is None or isinstance(rh_obj, detail_type):
+            continue
+        if rh_obj.IsSelectable(True, False, False, False):
+            filtered.append(obj_id)
+    return filtered
 
 
 def get_center_of_bounding_box(obj_ids: list[Any]) -> Rhino.Geometry.Point3d:
@@ -65,15 +75,17 @@ def get_center_of_bounding_box(obj_ids: list[Any]) -> Rhino.Geometry.Point3d:
     Raises:
         DetailError: If bounding box cannot be computed.
     """
-    bbox = rs.BoundingBox(obj_ids)
-    if not bbox:
+    objects = sc.doc.Objects
+    bbox = Rhino.Geometry.BoundingBox.Empty
+    for obj_id in obj_ids:
+        rh_obj = objects.Find(obj_id)
+        if rh_obj is not None:
+            bbox.Union(rh_obj.Geometry.GetBoundingBox(True))
+
+    if not bbox.IsValid:
         raise DetailError(Strings.MSG_FAILED_COMPUTE_BBOX)
 
-    return Rhino.Geometry.Point3d(
-        (bbox[0].X + bbox[6].X) / 2.0,
-        (bbox[0].Y + bbox[6].Y) / 2.0,
-        (bbox[0].Z + bbox[6].Z) / 2.0,
-    )
+    return bbox.Center
 
 
 def format_point3d(pt: Any) -> str:
@@ -100,13 +112,13 @@ def center_detail_view() -> None:
     """
     print("\n──────────── Center Detail View ────────────\n")
 
-    # Try to get active detail, otherwise prompt user
-    detail_id = get_active_detail_id()
-    if not detail_id:
+    # Try to get active detail, otherwise prompt user and validate the selection
+    rh_detail = get_active_detail()
+    if rh_detail is not None:
+        detail_id = rh_detail.Id
+    else:
         detail_id = require_user_selection(Strings.PROMPT_SELECT_DETAIL_VIEW, rs.filter.detail)
-
-    # Validate detail object
-    rh_detail = validate_detail_object(detail_id)
+        rh_detail = validate_detail_object(detail_id)
 
     # Check if detail is locked
     if rh_detail.IsLocked:
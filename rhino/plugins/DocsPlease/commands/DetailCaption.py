@@ -15,7 +15,12 @@ from __future__ import annotations
 
 import rhinoscriptsyntax as rs
 from libs.command_framework import rhino_command
-from libs.common_utils import require_user_selection, require_user_string, validate_detail_object
+from libs.common_utils import (
+    require_user_selection,
+    require_user_string,
+    suppress_redraw,
+    validate_detail_object,
+)
 from libs.constants import Constants, Strings
 from libs.detail_tools import DetailTools
 
@@ -53,7 +58,9 @@ def detail_caption() -> None:
         title_text = require_user_string(Strings.PROMPT_ENTER_TITLE, current_title, "Detail Caption")
         scale_text = DetailTools.get_detail_scale(detail_id)
 
-        DetailTools.update_caption_text(existing_caption, title_text, scale_text)
+        # Suppress repaints while both text objects are rewritten, then redraw once
+        with suppress_redraw():
+            DetailTools.update_caption_text(existing_caption, title_text, scale_text)
 
         caption_number = rs.TextObjectText(existing_caption[0])
         print(f"Caption {caption_number} updated for detail view")
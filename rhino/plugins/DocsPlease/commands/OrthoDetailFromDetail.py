@@ -15,10 +15,11 @@ from __future__ import annotations
 from typing import Any
 
 import rhinoscriptsyntax as rs
+import scriptcontext as sc
 from libs.alignment_tools import AlignmentTools
 from libs.camera_tools import CameraTools
 from libs.command_framework import rhino_command
-from libs.common_utils import require_user_point, validate_detail_object
+from libs.common_utils import require_user_point
 from libs.constants import Strings
 from libs.exceptions import CameraError, DetailError, UserCancelledError, ValidationError
 
@@ -51,12 +52,16 @@ def ortho_detail_from_detail() -> None:
     """
     print("\n────────── Ortho Detail From Detail ──────────")
 
-    # Refresh all detail metadata
-    AlignmentTools.refresh_all_detail_metadata()
-
     # Select source detail
     detail_id = AlignmentTools.get_detail_object_id(Strings.STEP1_PROMPT_SELECT_DETAIL)
-    detail_obj = validate_detail_object(detail_id)
+
+    # Only the source detail's camera is read, so refresh its metadata rather than every detail on the page
+    CameraTools.set_camera_metadata(detail_id)
+
+    # get_detail_object_id already checked the type; look the object up directly
+    detail_obj = sc.doc.Objects.FindId(detail_id)
+    if not isinstance(detail_obj, Rhino.DocObjects.DetailViewObject):
+        raise DetailError(Strings.MSG_INVALID_DETAIL_SELECTED, context=detail_id)
 
     # Get and validate camera metadata
     metadata = CameraTools.get_camera_metadata(detail_id)
@@ -76,7 +81,7 @@ def ortho_detail_from_detail() -> None:
         raise UserCancelledError(Strings.MSG_USER_CANCELLED_TARGET_VIEW)
 
     # Get bounding box and calculate original top-left
-    bbox = detail_obj.Geometry.GetBoundingBox(Rhino.Geometry.Plane.WorldXY)
+    bbox = detail_obj.Geometry.GetBoundingBox(True)
     top_left = Rhino.Geometry.Point3d(bbox.Min.X, bbox.Max.Y, 0)
 
     # Get insertion point
@@ -90,7 +95,7 @@ def ortho_detail_from_detail() -> None:
     if not new_id:
         raise DetailError(Strings.MSG_FAILED_CREATE_DETAIL)
 
-    new_obj = rs.coercerhinoobject(new_id)
+    new_obj = sc.doc.Objects.FindId(new_id)
     if not isinstance(new_obj, Rhino.DocObjects.DetailViewObject):
         raise DetailError("Failed to coerce new Detail View object")
 
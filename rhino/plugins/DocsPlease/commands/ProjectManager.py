@@ -13,6 +13,9 @@ applying them to layout pages.
 
 from __future__ import annotations
 
+from collections import defaultdict
+from typing import Any
+
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
 from libs.command_framework import rhino_command
@@ -22,12 +25,35 @@ from libs.common_utils import (
     require_user_string,
     validate_sheet_number,
 )
-from libs.constants import DISCIPLINE_CHOICES, L2_CHOICES_BY_MASTER, Constants, Metadata
+from libs.constants import (
+    DESIGNATION_LEVEL_CHOICES,
+    DISCIPLINE_CHOICES,
+    L2_CHOICES_BY_MASTER,
+    L2_CODE_INDEX,
+    L2_MASTER_BY_CODE,
+    Constants,
+    Metadata,
+)
 from libs.exceptions import LayoutError, ProjectConfigError, ValidationError
 from libs.layout_tools import LayoutTools
 from libs.project_config_tools import ProjectConfigTools
 
-import Rhino
+
+# --- Menu Options -----------------------------------------------------------
+# Built once at import; the source tables are static
+DISCIPLINE_OPTION_BY_CODE = {code: f"{code} - {name}" for code, name in DISCIPLINE_CHOICES}
+DISCIPLINE_CODE_BY_OPTION = {option: code for code, option in DISCIPLINE_OPTION_BY_CODE.items()}
+DISCIPLINE_NAME_BY_CODE = dict(DISCIPLINE_CHOICES)
+DESIGNATION_LEVEL_OPTIONS = [code for code, _ in DESIGNATION_LEVEL_CHOICES]
+L2_OPTION_BY_CODE = {code: f"{code} - {short}" for code, (short, _) in L2_CODE_INDEX.items()}
+L2_CODE_BY_OPTION = {option: code for code, option in L2_OPTION_BY_CODE.items()}
+L2_OPTIONS_BY_MASTER = {
+    master: [L2_OPTION_BY_CODE[code] for code, _, _ in entries] for master, entries in L2_CHOICES_BY_MASTER.items()
+}
+
+# --- Scale Defaults ---------------------------------------------------------
+DEFAULT_SCALE_IMPERIAL = 'SCALE: 1/4" = 1\'-0"'
+DEFAULT_SCALE_METRIC = "SCALE: 1:50"
 
 
 # --- Template Management ----------------------------------------------------
@@ -45,11 +71,10 @@ def apply_template(template_name: str) -> None:
         raise ProjectConfigError(f"Template '{template_name}' not found")
 
     # Determine default scale based on model units
-    units = CommonUtils.get_model_unit_system()
-    if units in {Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet}:
-        default_scale = template.get("default_scale_imperial", 'SCALE: 1/4" = 1\'-0"')
-    else:
-        default_scale = template.get("default_scale_metric", "SCALE: 1:50")
+    default_scale = get_default_scale(
+        template.get("default_scale_imperial", DEFAULT_SCALE_IMPERIAL),
+        template.get("default_scale_metric", DEFAULT_SCALE_METRIC),
+    )
 
     # Enable document sets from template
     document_sets = template.get("document_sets", [])
@@ -126,8 +151,14 @@ def edit_project_name() -> None:
 
     new_name = require_user_string("Enter new project name", current_name, "Edit Project Name")
 
+    # Accepting the prompt unchanged is a no-op; skip the document write and the layout sweep
+    if new_name == current_name:
+        print("[INFO] Project name unchanged")
+        return
+
     ProjectConfigTools.set_project_name(new_name)
-    print(f"[INFO] Project name updated to: {new_name}")
+    updated = LayoutTools.sync_project_name_to_all_layouts(new_name)
+    print(f"[INFO] Project name updated to: {new_name} ({updated} layouts synced)")
 
 
 # --- Document Set Management ------------------------------------------------
@@ -150,14 +181,11 @@ def manage_document_sets() -> None:
 
 def enable_document_sets() -> None:
     """Enable one or more document sets."""
-    # Get all discipline options
-    disc_options = [f"{code} - {name}" for code, name in DISCIPLINE_CHOICES]
-
     # Get currently enabled sets
     enabled = {code for code, _ in ProjectConfigTools.get_enabled_document_sets()}
 
     # Filter out already enabled
-    available_options = [opt for opt in disc_options if opt.split(" - ")[0] not in enabled]
+    available_options = [option for code, option in DISCIPLINE_OPTION_BY_CODE.items() if code not in enabled]
 
     if not available_options:
         print("[INFO] All document sets are already enabled")
@@ -166,20 +194,13 @@ def enable_document_sets() -> None:
     # Select discipline to enable
     choice = require_user_choice(available_options, "Select document set to enable", "Enable Document Set")
 
-    disc_code = choice.split(" - ")[0]
+    disc_code = DISCIPLINE_CODE_BY_OPTION[choice]
 
     # Prompt for designation level
-    level_choice = require_user_choice(["L1", "L2"], "Select designation level", "Designation Level")
-
-    # Determine default scale based on units
-    units = CommonUtils.get_model_unit_system()
-    if units in {Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet}:
-        default_scale = 'SCALE: 1/4" = 1\'-0"'
-    else:
-        default_scale = "SCALE: 1:50"
+    level_choice = require_user_choice(DESIGNATION_LEVEL_OPTIONS, "Select designation level", "Designation Level")
 
-    # Create config
-    config = {"designation_level": level_choice, "default_scale": default_scale, "enabled": True}
+    # Create config with the default scale for the model's units
+    config = {"designation_level": level_choice, "default_scale": get_default_scale(), "enabled": True}
 
     ProjectConfigTools.set_document_set(disc_code, config)
     print(f"[INFO] Enabled document set: {disc_code} ({level_choice})")
@@ -193,12 +214,11 @@ def configure_document_set() -> None:
         print("[INFO] No document sets enabled. Enable a document set first.")
         return
 
-    # Select document set to configure
-    options = [f"{code} - {get_discipline_name(code)}" for code, _ in enabled_sets]
-    choice = require_user_choice(options, "Select document set to configure", "Configure Document Set")
+    # Select document set to configure; the config parsed while listing is reused
+    sets_by_option = get_document_set_options(enabled_sets)
+    choice = require_user_choice(list(sets_by_option), "Select document set to configure", "Configure Document Set")
 
-    disc_code = choice.split(" - ")[0]
-    current_config = ProjectConfigTools.get_document_set(disc_code)
+    disc_code, current_config = sets_by_option[choice]
 
     if not current_config:
         print(f"[ERROR] Document set '{disc_code}' not found")
@@ -212,22 +232,13 @@ def configure_document_set() -> None:
     if config_choice == "Back":
         return
     if config_choice == "Change Designation Level":
-        new_level = require_user_choice(["L1", "L2"], "Select new designation level", "Designation Level")
+        new_level = require_user_choice(DESIGNATION_LEVEL_OPTIONS, "Select new designation level", "Designation Level")
         current_config["designation_level"] = new_level
         ProjectConfigTools.set_document_set(disc_code, current_config)
         print(f"[INFO] Updated {disc_code} designation level to {new_level}")
 
     elif config_choice == "Change Default Scale":
-        # Get available scales based on units
-        units = CommonUtils.get_model_unit_system()
-        if units in {Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet}:
-            scale_dict = Constants.ARCHITECTURAL_SCALES_IMPERIAL
-            scale_options = Constants.ARCHITECTURAL_SCALES_IMPERIAL_ORDER
-        else:
-            scale_dict = Constants.ARCHITECTURAL_SCALES_METRIC
-            scale_options = list(scale_dict.keys())
-
-        new_scale = require_user_choice(scale_options, "Select new default scale", "Default Scale")
+        new_scale = require_user_choice(get_scale_options(), "Select new default scale", "Default Scale")
         current_config["default_scale"] = new_scale
         ProjectConfigTools.set_document_set(disc_code, current_config)
         print(f"[INFO] Updated {disc_code} default scale to {new_scale}")
@@ -242,11 +253,10 @@ def disable_document_set() -> None:
         return
 
     # Select document set to disable
-    options = [f"{code} - {get_discipline_name(code)}" for code, _ in enabled_sets]
-    choice = require_user_choice(options, "Select document set to disable", "Disable Document Set")
+    sets_by_option = get_document_set_options(enabled_sets)
+    choice = require_user_choice(list(sets_by_option), "Select document set to disable", "Disable Document Set")
 
-    disc_code = choice.split(" - ")[0]
-    config = ProjectConfigTools.get_document_set(disc_code)
+    disc_code, config = sets_by_option[choice]
 
     if not config:
         print(f"[ERROR] Document set '{disc_code}' not found")
@@ -260,21 +270,26 @@ def disable_document_set() -> None:
 
 def view_current_configuration() -> None:
     """Display current project configuration."""
-    print("\n=== Current Project Configuration ===")
-    print(f"Project Name: {ProjectConfigTools.get_project_name()}")
-    print(f"Template: {rs.GetDocumentUserText('project_config_template') or 'Custom'}")
+    # Collect the report and write it to the command line in one print
+    lines = [
+        "\n=== Current Project Configuration ===",
+        f"Project Name: {ProjectConfigTools.get_project_name()}",
+        f"Template: {rs.GetDocumentUserText('project_config_template') or 'Custom'}",
+    ]
+    add = lines.append
 
     enabled_sets = ProjectConfigTools.get_enabled_document_sets()
-    print(f"\nEnabled Document Sets: {len(enabled_sets)}")
+    add(f"\nEnabled Document Sets: {len(enabled_sets)}")
 
     for disc_code, config in enabled_sets:
         disc_name = get_discipline_name(disc_code)
         level = config.get("designation_level", "N/A")
         scale = config.get("default_scale", "N/A")
-        print(f"  [{disc_code}] {disc_name}")
-        print(f"      Level: {level}, Default Scale: {scale}")
+        add(f"  [{disc_code}] {disc_name}")
+        add(f"      Level: {level}, Default Scale: {scale}")
 
-    print("=====================================\n")
+    add("=====================================\n")
+    print("\n".join(lines))
 
 
 # --- Helper Functions -------------------------------------------------------
@@ -287,10 +302,54 @@ def get_discipline_name(disc_code: str) -> str:
     Returns:
         Discipline name or "Unknown" if not found.
     """
-    for code, name in DISCIPLINE_CHOICES:
-        if code == disc_code:
-            return name
-    return "Unknown"
+    return DISCIPLINE_NAME_BY_CODE.get(disc_code, "Unknown")
+
+
+def get_document_set_options(doc_sets: list[tuple[str, dict[str, Any]]]) -> dict[str, tuple[str, dict[str, Any]]]:
+    """Label document sets for a picker.
+
+    Args:
+        doc_sets: (discipline_code, config) pairs, as returned by get_enabled_document_sets.
+
+    Returns:
+        Mapping of "code - name" labels to their (discipline_code, config) pair, in input order.
+    """
+    return {f"{code} - {get_discipline_name(code)}": (code, config) for code, config in doc_sets}
+
+
+def get_default_scale(imperial_scale: str = DEFAULT_SCALE_IMPERIAL, metric_scale: str = DEFAULT_SCALE_METRIC) -> str:
+    """Pick the default scale matching the model's unit system.
+
+    Args:
+        imperial_scale: Scale to use for inch or foot models.
+        metric_scale: Scale to use for any other unit system.
+
+    Returns:
+        The scale string for the current model units.
+    """
+    return imperial_scale if is_imperial_model() else metric_scale
+
+
+def get_scale_options() -> list[str]:
+    """Return the architectural scale names offered for the model's unit system.
+
+    Returns:
+        The precomputed imperial or metric scale list, in display order.
+    """
+    if is_imperial_model():
+        return Constants.ARCHITECTURAL_SCALES_IMPERIAL_ORDER
+    return Constants.ARCHITECTURAL_SCALES_METRIC_ORDER
+
+
+def is_imperial_model() -> bool:
+    """Check whether the model uses an imperial unit system.
+
+    The unit system is read on every call since it can change between commands.
+
+    Returns:
+        True for inch or foot models, False otherwise.
+    """
+    return CommonUtils.get_model_unit_system() in Constants.IMPERIAL_UNIT_SYSTEMS
 
 
 # --- Layout Application -----------------------------------------------------
@@ -314,10 +373,9 @@ def apply_to_layout() -> None:
         raise ValidationError("No document sets enabled. Configure project first.")
 
     # Select document set
-    options = [f"{code} - {get_discipline_name(code)}" for code, _ in doc_sets]
-    choice = require_user_choice(options, "Select document set for this layout", "Apply to Layout")
-    disc_code = choice.split(" - ")[0]
-    doc_set = ProjectConfigTools.get_document_set(disc_code)
+    sets_by_option = get_document_set_options(doc_sets)
+    choice = require_user_choice(list(sets_by_option), "Select document set for this layout", "Apply to Layout")
+    disc_code, doc_set = sets_by_option[choice]
 
     if not doc_set:
         raise ValidationError(f"Document set '{disc_code}' not found")
@@ -326,13 +384,14 @@ def apply_to_layout() -> None:
     level = doc_set["designation_level"]
     final_code = disc_code
 
-    if level == "L2" and disc_code in L2_CHOICES_BY_MASTER:
+    if level == "L2" and disc_code in L2_OPTIONS_BY_MASTER:
         # Show L2 sub-discipline picker
-        sub_options = [f"{c2} - {short}" for c2, short, _ in L2_CHOICES_BY_MASTER[disc_code]]
         sub_choice = require_user_choice(
-            sub_options, f"Select {get_discipline_name(disc_code)} sub-discipline", "Apply to Layout"
+            L2_OPTIONS_BY_MASTER[disc_code],
+            f"Select {get_discipline_name(disc_code)} sub-discipline",
+            "Apply to Layout",
         )
-        final_code = sub_choice.split(" - ")[0]
+        final_code = L2_CODE_BY_OPTION[sub_choice]
 
     # Get sheet info
     sheet_name = require_user_string("Enter sheet name (e.g., Floor Plan)", "", "Sheet Name")
@@ -354,17 +413,22 @@ def apply_to_layout() -> None:
 
     # Apply to viewport
     vp = sc.doc.Views.ActiveView.ActiveViewport
-    project_name = ProjectConfigTools.get_project_name()
-
-    vp.SetUserString(Metadata.PROJECT_NAME, project_name)
-    vp.SetUserString(Metadata.PAGE_SCALE, doc_set["default_scale"])
-    vp.SetUserString(Metadata.DESIGNATION_LEVEL, level)
-    vp.SetUserString(Metadata.SHEET_INDICATOR, final_code)
-    vp.SetUserString(Metadata.SHEET_NAME, sheet_name)
-    vp.SetUserString(Metadata.SHEET_NUMBER, sheet_number)
-    vp.SetUserString(Metadata.SHEET_ID_FULL, sheet_id)
-    vp.SetUserString(Metadata.SCALE_INHERITED, "true")
-    vp.SetUserString(Metadata.COMPLETION_FLAG, "true")
+    metadata = {
+        Metadata.PROJECT_NAME: ProjectConfigTools.get_project_name(),
+        Metadata.PAGE_SCALE: doc_set["default_scale"],
+        Metadata.DESIGNATION_LEVEL: level,
+        Metadata.SHEET_INDICATOR: final_code,
+        Metadata.SHEET_NAME: sheet_name,
+        Metadata.SHEET_NUMBER: sheet_number,
+        Metadata.SHEET_ID_FULL: sheet_id,
+        Metadata.SCALE_INHERITED: "true",
+        Metadata.COMPLETION_FLAG: "true",
+    }
+
+    # Only populated values cross into the viewport; writing None would just delete the key
+    for key, value in metadata.items():
+        if value is not None:
+            vp.SetUserString(key, value)
 
     print("\n[SUCCESS] Layout configured successfully!")
     print(f"  Sheet ID: {sheet_id}")
@@ -380,65 +444,72 @@ def view_overview() -> None:
     Shows project name, template, and all enabled document sets with their
     layouts. Highlights document sets with no layouts.
     """
-    print("\n" + "=" * 60)
-    print("PROJECT OVERVIEW")
-    print("=" * 60)
+    # Collect the report and write it to the command line in one print
+    lines = ["\n" + "=" * 60, "PROJECT OVERVIEW", "=" * 60]
+    add = lines.append
 
     # Project info
     project_name = ProjectConfigTools.get_project_name()
     template = rs.GetDocumentUserText("project_config_template") or "Custom"
 
-    print(f"\nProject: {project_name}")
-    print(f"Template: {template}")
+    add(f"\nProject: {project_name}")
+    add(f"Template: {template}")
 
     # Group layouts by discipline
     page_views = sc.doc.Views.GetPageViews()
-    layouts_by_disc: dict[str, list[dict[str, str | bool]]] = {}
+    layouts_by_disc: defaultdict[str, list[dict[str, str | bool]]] = defaultdict(list)
+
+    # Bind the metadata keys once rather than resolving class attributes per layout
+    key_indicator = Metadata.SHEET_INDICATOR
+    key_id = Metadata.SHEET_ID_FULL
+    key_name = Metadata.SHEET_NAME
+    key_scale = Metadata.PAGE_SCALE
+    key_inherited = Metadata.SCALE_INHERITED
 
     for view in page_views:
-        vp = view.ActiveViewport
-        disc = vp.GetUserString(Metadata.SHEET_INDICATOR)
+        # One interop call per viewport; lookups on the returned collection stay in-process
+        user_strings = view.ActiveViewport.GetUserStrings()
+        disc = user_strings[key_indicator]
 
         if disc:
-            if disc not in layouts_by_disc:
-                layouts_by_disc[disc] = []
-
-            layouts_by_disc[disc].append({
-                "id": vp.GetUserString(Metadata.SHEET_ID_FULL),
-                "name": vp.GetUserString(Metadata.SHEET_NAME),
-                "scale": vp.GetUserString(Metadata.PAGE_SCALE),
-                "inherited": vp.GetUserString(Metadata.SCALE_INHERITED) == "true",
+            # L2 layouts carry their sub-discipline code; file them under the master document set
+            layouts_by_disc[L2_MASTER_BY_CODE.get(disc, disc)].append({
+                "id": user_strings[key_id],
+                "name": user_strings[key_name],
+                "scale": user_strings[key_scale],
+                "inherited": user_strings[key_inherited] == "true",
             })
 
     # Display document sets
-    print("\n" + "-" * 60)
-    print("DOCUMENT SETS")
-    print("-" * 60)
+    add("\n" + "-" * 60)
+    add("DOCUMENT SETS")
+    add("-" * 60)
 
     enabled_sets = ProjectConfigTools.get_enabled_document_sets()
 
     if not enabled_sets:
-        print("\n[WARNING] No document sets enabled")
+        add("\n[WARNING] No document sets enabled")
     else:
         for disc_code, config in enabled_sets:
             disc_name = get_discipline_name(disc_code)
             level = config.get("designation_level", "N/A")
             default_scale = config.get("default_scale", "N/A")
 
-            print(f"\n[{disc_code}] {disc_name} ({level})")
-            print(f"    Default Scale: {default_scale}")
+            add(f"\n[{disc_code}] {disc_name} ({level})")
+            add(f"    Default Scale: {default_scale}")
 
             layouts = layouts_by_disc.get(disc_code, [])
-            print(f"    Layouts: {len(layouts)}")
+            add(f"    Layouts: {len(layouts)}")
 
             if layouts:
                 for layout in layouts:
                     status = "inherited" if layout["inherited"] else f"overridden: {layout['scale']}"
-                    print(f"      • {layout['id']}: {layout['name']} ({status})")
+                    add(f"      • {layout['id']}: {layout['name']} ({status})")
             else:
-                print("      [WARNING] No layouts for this document set")
+                add("      [WARNING] No layouts for this document set")
 
-    print("\n" + "=" * 60 + "\n")
+    add("\n" + "=" * 60 + "\n")
+    print("\n".join(lines))
 
 
 # --- Main Command Entry Point -----------------------------------------------
@@ -50,7 +50,7 @@ def set_detail_view() -> None:
     # Get projection choice from user
     projection = require_user_choice(projections, "Select View Projection", "Set Detail View")
 
-    # Apply projection to each detail
+    # Apply projection to each detail (rhino_command redraws once when done)
     success_count = 0
     failed = []
 
@@ -63,9 +63,9 @@ def set_detail_view() -> None:
 
             # Apply appropriate projection method
             if "Isometric" in projection:
-                CameraTools.set_isometric_projection(detail_id, projection)
+                CameraTools.set_isometric_projection(detail_id, projection, defer_redraw=True)
             else:
-                CameraTools.set_camera_projection_for_named_view(detail_id, projection)
+                CameraTools.set_camera_projection_for_named_view(detail_id, projection, defer_redraw=True)
 
             # Update camera metadata
             CameraTools.set_camera_metadata(detail_id)
@@ -12,21 +12,29 @@ Unified scale command for setting detail view scales. Handles all scale types
 details on page). Integrates with project-level document set configuration.
 """
 
-import rhinoscriptsyntax as rs
 import scriptcontext as sc
 from libs.command_framework import rhino_command
-from libs.common_utils import CommonUtils, require_user_choice, validate_environment_units
-from libs.constants import Constants, Metadata
+from libs.common_utils import get_selected_detail_ids, require_user_choice, validate_environment_units
+from libs.constants import L2_MASTER_BY_CODE, Constants, Metadata
 from libs.detail_tools import DetailTools
 from libs.exceptions import ValidationError
 from libs.project_config_tools import ProjectConfigTools
 
-import Rhino
+
+# --- Scale Tables -----------------------------------------------------------
+# Scale types offered per unit family, and the select_scale mode for each type
+IMPERIAL_SCALE_TYPES = ["Architectural", "Engineering"]
+METRIC_SCALE_TYPES = ["Metric"]
+SCALE_MODE_BY_TYPE = {
+    "Architectural": "Architectural",
+    "Engineering": "Engineering",
+    "Metric": "Architectural",
+}
 
 
 # --- Main Scale Command -----------------------------------------------------
 @rhino_command(requires_layout=True, undo_description="Set Detail Scale")
-def set_scale() -> None:  # noqa: PLR0912, PLR0915
+def set_scale() -> None:
     """Unified scale command for detail views with smart selection handling.
 
     Supports pre-selection of details to skip operation prompt. Handles all scale types
@@ -39,46 +47,25 @@ def set_scale() -> None:  # noqa: PLR0912, PLR0915
         EnvironmentError: If unit system is not supported.
     """
     # Validate units
-    validate_environment_units(Constants.SUPPORTED_UNIT_SYSTEMS)
-    units = CommonUtils.get_model_unit_system()
+    units = validate_environment_units(Constants.SUPPORTED_UNIT_SYSTEMS)
 
     # Check for pre-selected details
-    preselected = rs.SelectedObjects(include_lights=False, include_grips=False) or []
-    preselected_details = [obj_id for obj_id in preselected if rs.IsDetail(obj_id)]
+    preselected_details = get_selected_detail_ids()
 
     # Determine scale types based on model units
-    if units in {Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet}:
-        scale_types = ["Architectural", "Engineering"]
-    else:
-        scale_types = ["Metric"]
+    scale_types = IMPERIAL_SCALE_TYPES if units in Constants.IMPERIAL_UNIT_SYSTEMS else METRIC_SCALE_TYPES
 
-    # Select scale type
+    # Select scale type; Architectural is only offered for imperial models
     scale_type = require_user_choice(scale_types, "Select scale type", "Set Scale")
 
-    # Get scale dictionary and mode based on scale type
-    if scale_type == "Architectural":
-        if units in {Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet}:
-            scale_dict = Constants.ARCHITECTURAL_SCALES_IMPERIAL
-        else:
-            scale_dict = Constants.ARCHITECTURAL_SCALES_METRIC
-        mode = "Architectural"
-    elif scale_type == "Engineering":
-        scale_dict = Constants.ENGINEERING_SCALES_IMPERIAL
-        mode = "Engineering"
-    else:  # Metric
-        scale_dict = Constants.ARCHITECTURAL_SCALES_METRIC
-        mode = "Architectural"
-
-    # Select scale
-    p_len, m_len, label = DetailTools.select_scale(scale_dict, mode, "Select scale")
+    # Select scale; the table follows from the mode and the model units
+    p_len, m_len, label = DetailTools.select_scale(mode=SCALE_MODE_BY_TYPE[scale_type], title="Select scale")
 
     # Smart operation selection based on pre-selection
     if preselected_details:
         # Use pre-selected details, skip operation prompt
-        ids = preselected_details
-        for did in ids:
-            DetailTools.set_detail_scale(did, p_len, m_len, label)
-        print(f"Applied scale {label} to {len(ids)} detail(s)")
+        count = DetailTools.set_details_scale(preselected_details, p_len, m_len, label)
+        print(f"Applied scale {label} to {count} detail(s)")
     else:
         # No pre-selection, show operation prompt
         operation = require_user_choice(
@@ -88,24 +75,23 @@ def set_scale() -> None:  # noqa: PLR0912, PLR0915
         # Apply scale based on operation
         if operation == "Set Selected Details":
             ids = DetailTools.get_detail_objects(preselect_allowed=True)
-            for did in ids:
-                DetailTools.set_detail_scale(did, p_len, m_len, label)
-            print(f"Applied scale {label} to {len(ids)} detail(s)")
+            count = DetailTools.set_details_scale(ids, p_len, m_len, label)
+            print(f"Applied scale {label} to {count} detail(s)")
         else:  # Set All Details on Page
             pageview = sc.doc.Views.ActiveView
             details = pageview.GetDetailViews()
             if not details:
                 raise ValidationError("No details found on this layout")
-            for detail in details:
-                DetailTools.set_detail_scale(detail.Id, p_len, m_len, label)
-            print(f"Applied scale {label} to all {len(details)} detail(s) on page")
+            count = DetailTools.set_details_scale([detail.Id for detail in details], p_len, m_len, label)
+            print(f"Applied scale {label} to all {count} detail(s) on page")
 
     # Check if scale differs from document set default and update SCALE_INHERITED flag
     vp = sc.doc.Views.ActiveView.ActiveViewport
     sheet_indicator = vp.GetUserString(Metadata.SHEET_INDICATOR)
 
     if sheet_indicator:
-        doc_set = ProjectConfigTools.get_document_set(sheet_indicator)
+        # L2 sheet indicators (e.g. "AD") belong to their master discipline's document set
+        doc_set = ProjectConfigTools.get_document_set(L2_MASTER_BY_CODE.get(sheet_indicator, sheet_indicator))
         if doc_set:
             default_scale = doc_set.get("default_scale")
             if default_scale and label != default_scale:
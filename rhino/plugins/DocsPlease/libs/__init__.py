@@ -12,13 +12,15 @@ Package initializer that exports all public classes and functions
 
 from .alignment_tools import AlignmentTools
 from .camera_tools import CameraTools
-from .command_framework import require_layout_view, rhino_command, safe_undo_block
+from .command_framework import require_layout_view, rhino_command, safe_undo_block, undo_block
 from .common_utils import (
     CommonUtils,
+    get_selected_detail_ids,
     require_user_choice,
     require_user_point,
     require_user_selection,
     require_user_string,
+    suppress_redraw,
     validate_detail_object,
     validate_environment_units,
     validate_sheet_number,
@@ -27,6 +29,9 @@ from .constants import (
     DESIGNATION_LEVEL_CHOICES,
     DISCIPLINE_CHOICES,
     L2_CHOICES_BY_MASTER,
+    L2_CODE_INDEX,
+    L2_MASTER_BY_CODE,
+    METADATA_KEYS,
     Constants,
     Metadata,
     Strings,
@@ -53,6 +58,9 @@ __all__ = [  # noqa: RUF022
     "DESIGNATION_LEVEL_CHOICES",
     "DISCIPLINE_CHOICES",
     "L2_CHOICES_BY_MASTER",
+    "L2_CODE_INDEX",
+    "L2_MASTER_BY_CODE",
+    "METADATA_KEYS",
     # Main tool classes
     "AlignmentTools",
     "CameraTools",
@@ -67,11 +75,14 @@ __all__ = [  # noqa: RUF022
     "rhino_command",
     "require_layout_view",
     "safe_undo_block",
+    "undo_block",
     # Validation functions
+    "get_selected_detail_ids",
     "require_user_choice",
     "require_user_point",
     "require_user_selection",
     "require_user_string",
+    "suppress_redraw",
     "validate_detail_object",
     "validate_environment_units",
     "validate_sheet_number",
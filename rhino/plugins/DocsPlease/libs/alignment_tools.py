@@ -24,6 +24,17 @@ from .constants import Constants, Strings
 from .exceptions import DetailError, TransformError, UserCancelledError
 
 
+_Point3d = Rhino.Geometry.Point3d
+_Vector3d = Rhino.Geometry.Vector3d
+_TOLERANCE = Constants.TOLERANCE
+
+
+# --- Projection Options ---------------------------------------------------
+PROJECTION_NAMES = ("Top", "Bottom", "Front", "Back", "Left", "Right")
+# Picker options for each current view, i.e. every other projection in display order
+TARGET_PROJECTION_OPTIONS = {view: [name for name in PROJECTION_NAMES if name != view] for view in PROJECTION_NAMES}
+
+
 # --- Alignment Tools ------------------------------------------------------
 class AlignmentTools:
     """Tools for aligning Detail Views on a Layout Page."""
@@ -96,10 +107,7 @@ class AlignmentTools:
         Raises:
             TransformError: If invalid points provided or invalid alignment choice.
         """
-        if not all([
-            isinstance(pt_parent, Rhino.Geometry.Point3d),
-            isinstance(pt_child, Rhino.Geometry.Point3d),
-        ]):
+        if not (isinstance(pt_parent, _Point3d) and isinstance(pt_child, _Point3d)):
             raise TransformError(
                 "Invalid points provided for alignment calculation",
                 context={"pt_parent": pt_parent, "pt_child": pt_child},
@@ -107,13 +115,13 @@ class AlignmentTools:
 
         if align_choice == "Horizontal":
             delta_y = pt_parent.Y - pt_child.Y
-            if abs(delta_y) > Constants.TOLERANCE:
-                return Rhino.Geometry.Vector3d(0, delta_y, 0)
+            if abs(delta_y) > _TOLERANCE:
+                return _Vector3d(0, delta_y, 0)
 
         elif align_choice == "Vertical":
             delta_x = pt_parent.X - pt_child.X
-            if abs(delta_x) > Constants.TOLERANCE:
-                return Rhino.Geometry.Vector3d(delta_x, 0, 0)
+            if abs(delta_x) > _TOLERANCE:
+                return _Vector3d(delta_x, 0, 0)
 
         else:
             raise TransformError(
@@ -133,9 +141,7 @@ class AlignmentTools:
         Returns:
             Selected target view name.
         """
-        options = ["Top", "Bottom", "Front", "Back", "Left", "Right"]
-        if current_view in options:
-            options.remove(current_view)
+        options = TARGET_PROJECTION_OPTIONS.get(current_view) or list(PROJECTION_NAMES)
 
         return rs.ListBox(
             options,
@@ -151,8 +157,6 @@ class AlignmentTools:
             print("Warning: Active view is not a Layout.")
             return
 
-        details = pageview.GetDetailViews()
-        for detail in details:
-            CameraTools.set_camera_metadata(detail.Id)
+        count = CameraTools.set_camera_metadata_bulk(pageview.GetDetailViews())
 
-        print(f"[DEBUG] Refreshed metadata on {len(details)} Detail View(s)")
+        print(f"[DEBUG] Refreshed metadata on {count} Detail View(s)")
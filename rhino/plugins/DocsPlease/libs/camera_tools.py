@@ -13,7 +13,7 @@ Camera metadata capture, storage, and restoration for detail views
 from __future__ import annotations
 
 import math
-import traceback
+from collections.abc import Callable
 from typing import Any
 
 import rhinoscriptsyntax as rs
@@ -22,10 +22,103 @@ import System
 
 import Rhino
 
+from .common_utils import suppress_redraw
 from .constants import Constants
 from .exceptions import CameraError
 
 
+_Point3d = Rhino.Geometry.Point3d
+_Vector3d = Rhino.Geometry.Vector3d
+_INV = System.Globalization.CultureInfo.InvariantCulture
+_XYZ_FORMAT = "{0:R},{1:R},{2:R}"
+
+# Named view looking along each axis, indexed by 2 * axis + (component < 0)
+_NAMED_VIEW_BY_AXIS = ("Right", "Left", "Back", "Front", "Bottom", "Top")
+
+
+def _unit_vector(x: float, y: float, z: float) -> Rhino.Geometry.Vector3d:
+    """Return a unitized Vector3d for the given components."""
+    vector = _Vector3d(x, y, z)
+    vector.Unitize()
+    return vector
+
+
+# --- Projection Cameras ---------------------------------------------------
+# (direction, up) per projection, built once; directions are already unit length.
+_Z_UP = _Vector3d(0, 0, 1)
+_NAMED_VIEW_CAMERAS = {
+    "Top": (_Vector3d(0, 0, -1), _Vector3d(0, 1, 0)),
+    "Bottom": (_Vector3d(0, 0, 1), _Vector3d(0, 1, 0)),
+    "Front": (_Vector3d(0, -1, 0), _Z_UP),
+    "Back": (_Vector3d(0, 1, 0), _Z_UP),
+    "Left": (_Vector3d(-1, 0, 0), _Z_UP),
+    "Right": (_Vector3d(1, 0, 0), _Z_UP),
+}
+_ISOMETRIC_CAMERAS = {
+    "SW Isometric": (_unit_vector(-1, -1, 1), _Z_UP),
+    "SE Isometric": (_unit_vector(1, -1, 1), _Z_UP),
+    "NE Isometric": (_unit_vector(1, 1, 1), _Z_UP),
+    "NW Isometric": (_unit_vector(-1, 1, 1), _Z_UP),
+}
+
+
+# --- Camera Metadata Schema -----------------------------------------------
+def _string_to_point3d(s: str) -> Rhino.Geometry.Point3d:
+    """Convert a comma-separated string back to Rhino.Geometry.Point3d.
+
+    Args:
+        s: Comma-separated string of coordinates.
+
+    Returns:
+        Point3d object.
+
+    Raises:
+        CameraError: If string cannot be converted to Point3d.
+    """
+    if not s:
+        raise CameraError("Cannot convert empty string to Point3d")
+    try:
+        x, y, z = map(float, s.split(",", 2))
+    except ValueError as e:
+        raise CameraError(f"Error converting string '{s}' to Point3d: {e}", context=s) from e
+    return _Point3d(x, y, z)
+
+
+def _string_to_vector3d(s: str) -> Rhino.Geometry.Vector3d:
+    """Convert a comma-separated string back to Rhino.Geometry.Vector3d.
+
+    Args:
+        s: Comma-separated string of coordinates.
+
+    Returns:
+        Vector3d object.
+
+    Raises:
+        CameraError: If string cannot be converted to Vector3d.
+    """
+    if not s:
+        raise CameraError("Cannot convert empty string to Vector3d")
+    try:
+        x, y, z = map(float, s.split(",", 2))
+    except ValueError as e:
+        raise CameraError(f"Error converting string '{s}' to Vector3d: {e}", context=s) from e
+    return _Vector3d(x, y, z)
+
+
+# (key, user string key, converter) per stored field, resolved once at import.
+_METADATA_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "location": _string_to_point3d,
+    "direction": _string_to_vector3d,
+    "up": _string_to_vector3d,
+    "target": _string_to_point3d,
+    "lens_length": float,
+    "page_to_model_ratio": float,
+}
+_METADATA_SCHEMA: tuple[tuple[str, str, Callable[[str], Any]], ...] = tuple(
+    (key, user_key, _METADATA_CONVERTERS.get(key, str)) for key, user_key in Constants.CAMERA_METADATA_KEYS.items()
+)
+
+
 # --- Camera Tools ---------------------------------------------------------
 class CameraTools:
     """Tools for reading and writing camera metadata to Detail View objects."""
@@ -44,11 +137,10 @@ class CameraTools:
         Raises:
             CameraError: If point is not a valid Point3d.
         """
-        if not isinstance(point, Rhino.Geometry.Point3d):
+        if not isinstance(point, _Point3d):
             raise CameraError(f"Invalid point type: expected Point3d, got {type(point).__name__}", context=point)
         try:
-            culture = System.Globalization.CultureInfo.InvariantCulture
-            return f"{point.X.ToString(culture)},{point.Y.ToString(culture)},{point.Z.ToString(culture)}"
+            return System.String.Format(_INV, _XYZ_FORMAT, point.X, point.Y, point.Z)
         except (AttributeError, TypeError):
             return f"{point.X},{point.Y},{point.Z}"
 
@@ -65,66 +157,13 @@ class CameraTools:
         Raises:
             CameraError: If vector is not a valid Vector3d.
         """
-        if not isinstance(vector, Rhino.Geometry.Vector3d):
+        if not isinstance(vector, _Vector3d):
             raise CameraError(f"Invalid vector type: expected Vector3d, got {type(vector).__name__}", context=vector)
         try:
-            culture = System.Globalization.CultureInfo.InvariantCulture
-            return f"{vector.X.ToString(culture)},{vector.Y.ToString(culture)},{vector.Z.ToString(culture)}"
+            return System.String.Format(_INV, _XYZ_FORMAT, vector.X, vector.Y, vector.Z)
         except (AttributeError, TypeError):
             return f"{vector.X},{vector.Y},{vector.Z}"
 
-    @staticmethod
-    def _string_to_point3d(s: str) -> Rhino.Geometry.Point3d:
-        """Convert a comma-separated string back to Rhino.Geometry.Point3d.
-
-        Args:
-            s: Comma-separated string of coordinates.
-
-        Returns:
-            Point3d object.
-
-        Raises:
-            CameraError: If string cannot be converted to Point3d.
-        """
-        if not s:
-            raise CameraError("Cannot convert empty string to Point3d")
-        try:
-            parts = s.split(",")
-            if len(parts) != 3:
-                raise CameraError(f"Invalid Point3d string format: expected 3 values, got {len(parts)}", context=s)
-            x = float(parts[0])
-            y = float(parts[1])
-            z = float(parts[2])
-            return Rhino.Geometry.Point3d(x, y, z)
-        except (ValueError, IndexError) as e:
-            raise CameraError(f"Error converting string '{s}' to Point3d: {e}", context=s) from e
-
-    @staticmethod
-    def _string_to_vector3d(s: str) -> Rhino.Geometry.Vector3d:
-        """Convert a comma-separated string back to Rhino.Geometry.Vector3d.
-
-        Args:
-            s: Comma-separated string of coordinates.
-
-        Returns:
-            Vector3d object.
-
-        Raises:
-            CameraError: If string cannot be converted to Vector3d.
-        """
-        if not s:
-            raise CameraError("Cannot convert empty string to Vector3d")
-        try:
-            parts = s.split(",")
-            if len(parts) != 3:
-                raise CameraError(f"Invalid Vector3d string format: expected 3 values, got {len(parts)}", context=s)
-            x = float(parts[0])
-            y = float(parts[1])
-            z = float(parts[2])
-            return Rhino.Geometry.Vector3d(x, y, z)
-        except (ValueError, IndexError) as e:
-            raise CameraError(f"Error converting string '{s}' to Vector3d: {e}", context=s) from e
-
     # --- Camera Metadata Read ---------------------------------------------
     @staticmethod
     def get_camera_metadata(detail_id: object) -> dict[str, Any]:
@@ -143,29 +182,27 @@ class CameraTools:
         if not rh_obj or not isinstance(rh_obj, Rhino.DocObjects.DetailViewObject):
             raise CameraError("Invalid Detail ID or object type provided to get_camera_metadata", context=detail_id)
 
+        attrs = rh_obj.Attributes
+
+        # Details that were never captured lack every key; stop at the first instead of probing all of them
+        sentinel_key = _METADATA_SCHEMA[0][1]
+        if attrs.GetUserString(sentinel_key) is None:
+            raise CameraError(
+                f"Missing camera metadata keys: {sentinel_key}",
+                context={"detail_id": detail_id, "missing_keys": [sentinel_key]},
+            )
+
         metadata = {}
         missing_keys = []
 
-        for key, user_key in Constants.CAMERA_METADATA_KEYS.items():
-            value_str = rh_obj.Attributes.GetUserString(user_key)
+        for key, user_key, convert in _METADATA_SCHEMA:
+            value_str = attrs.GetUserString(user_key)
             if value_str is None:
                 missing_keys.append(user_key)
                 continue
 
             try:
-                if key in {"location", "target"}:
-                    converted_value = CameraTools._string_to_point3d(value_str)
-                elif key in {"direction", "up"}:
-                    converted_value = CameraTools._string_to_vector3d(value_str)
-                elif key in {"lens_length", "page_to_model_ratio"}:
-                    converted_value = float(value_str)
-                elif key == "projection_mode":
-                    converted_value = value_str
-                else:
-                    converted_value = value_str
-
-                metadata[key] = converted_value
-
+                metadata[key] = convert(value_str)
             except (ValueError, TypeError, CameraError) as e:
                 raise CameraError(
                     f"Error converting camera metadata key '{key}': {e}",
@@ -201,6 +238,36 @@ class CameraTools:
         if not rh_obj or not isinstance(rh_obj, Rhino.DocObjects.DetailViewObject):
             raise CameraError("Invalid Detail ID or object type provided to set_camera_metadata", context=detail_id)
 
+        CameraTools._store_camera_metadata(rh_obj, detail_id)
+
+    @staticmethod
+    def set_camera_metadata_bulk(details: list[Rhino.DocObjects.DetailViewObject]) -> int:
+        """Store camera metadata for several Detail Views with repaints suppressed.
+
+        Takes the detail objects themselves (e.g. from RhinoPageView.GetDetailViews)
+        so each one is written without being looked up again by ID.
+
+        Args:
+            details: Detail view objects to update.
+
+        Returns:
+            Number of detail views whose stored metadata changed.
+
+        Raises:
+            CameraError: If camera metadata cannot be stored for a detail.
+        """
+        updated = 0
+        with suppress_redraw():
+            for detail in details:
+                updated += CameraTools._store_camera_metadata(detail, detail.Id)
+        return updated
+
+    @staticmethod
+    def _store_camera_metadata(rh_obj: Rhino.DocObjects.DetailViewObject, detail_id: object) -> bool:
+        """Write the camera state of a resolved Detail View object to its user strings.
+
+        Returns False without touching the document when the stored strings already match.
+        """
         detail_vp = rh_obj.Viewport
         if not detail_vp:
             raise CameraError("Could not retrieve ViewportInfo for detail", context=detail_id)
@@ -218,32 +285,33 @@ class CameraTools:
             raise CameraError(f"Error accessing camera properties for detail: {e}", context=detail_id) from e
 
         try:
-            attribs = rh_obj.Attributes.Duplicate()
-
-            loc_str = CameraTools._point3d_to_string(location)
-            dir_str = CameraTools._vector3d_to_string(direction)
-            up_str = CameraTools._vector3d_to_string(up)
-            tgt_str = CameraTools._point3d_to_string(target)
-            lens_str = str(lens_length)
-            ratio_str = str(ratio)
-
-            attribs.SetUserString(Constants.CAMERA_METADATA_KEYS["location"], loc_str)
-            attribs.SetUserString(Constants.CAMERA_METADATA_KEYS["direction"], dir_str)
-            attribs.SetUserString(Constants.CAMERA_METADATA_KEYS["up"], up_str)
-            attribs.SetUserString(Constants.CAMERA_METADATA_KEYS["target"], tgt_str)
-            attribs.SetUserString(Constants.CAMERA_METADATA_KEYS["lens_length"], lens_str)
-            attribs.SetUserString(Constants.CAMERA_METADATA_KEYS["projection_mode"], projection_mode)
-            attribs.SetUserString(Constants.CAMERA_METADATA_KEYS["page_to_model_ratio"], ratio_str)
-
-            if not sc.doc.Objects.ModifyAttributes(rh_obj.Id, attribs, True):
+            # Inputs come straight from the viewport, so format them without the type-checked helpers
+            fmt = System.String.Format
+            values = {
+                "location": fmt(_INV, _XYZ_FORMAT, location.X, location.Y, location.Z),
+                "direction": fmt(_INV, _XYZ_FORMAT, direction.X, direction.Y, direction.Z),
+                "up": fmt(_INV, _XYZ_FORMAT, up.X, up.Y, up.Z),
+                "target": fmt(_INV, _XYZ_FORMAT, target.X, target.Y, target.Z),
+                "lens_length": str(lens_length),
+                "projection_mode": projection_mode,
+                "page_to_model_ratio": str(ratio),
+            }
+            attribs = rh_obj.Attributes
+            if all(attribs.GetUserString(user_key) == values[key] for key, user_key, _ in _METADATA_SCHEMA):
+                return False
+
+            # Only user strings change, so edit the live attributes and commit rather than cloning them
+            for key, user_key, _ in _METADATA_SCHEMA:
+                attribs.SetUserString(user_key, values[key])
+
+            if not rh_obj.CommitChanges():
                 raise CameraError("Failed to modify attributes for detail", context=detail_id)
 
         except CameraError:
             raise
         except (AttributeError, RuntimeError) as e:
-            raise CameraError(
-                f"Error setting/storing camera metadata for detail: {e}\n{traceback.format_exc()}", context=detail_id
-            ) from e
+            raise CameraError(f"Error setting/storing camera metadata for detail: {e}", context=detail_id) from e
+        return True
 
     # --- Camera Projection Utilities --------------------------------------
     @staticmethod
@@ -257,44 +325,31 @@ class CameraTools:
             Named view string (Top, Bottom, Front, Back, Left, or Right).
 
         Raises:
-            CameraError: If vector is invalid or cannot be mapped to a named view.
+            CameraError: If vector is not a Vector3d.
         """
-        if not isinstance(vector, Rhino.Geometry.Vector3d):
+        if not isinstance(vector, _Vector3d):
             raise CameraError(f"Invalid vector type: expected Vector3d, got {type(vector).__name__}", context=vector)
 
         x, y, z = vector.X, vector.Y, vector.Z
         abs_x, abs_y, abs_z = abs(x), abs(y), abs(z)
 
         if abs_x >= abs_y and abs_x >= abs_z:
-            v = Rhino.Geometry.Vector3d(math.copysign(1, x), 0, 0)
-        elif abs_y >= abs_x and abs_y >= abs_z:
-            v = Rhino.Geometry.Vector3d(0, math.copysign(1, y), 0)
+            axis, component = 0, x
+        elif abs_y >= abs_z:
+            axis, component = 1, y
         else:
-            v = Rhino.Geometry.Vector3d(0, 0, math.copysign(1, z))
-
-        key = (round(v.X), round(v.Y), round(v.Z))
-
-        mapping = {
-            (0, 0, -1): "Top",
-            (0, 0, 1): "Bottom",
-            (0, -1, 0): "Front",
-            (0, 1, 0): "Back",
-            (-1, 0, 0): "Left",
-            (1, 0, 0): "Right",
-        }
+            axis, component = 2, z
 
-        result = mapping.get(key)
-        if result is None:
-            raise CameraError("Cannot map camera direction to named view", context={"vector": vector, "key": key})
-        return result
+        return _NAMED_VIEW_BY_AXIS[2 * axis + (math.copysign(1, component) < 0)]
 
     @staticmethod
-    def set_camera_projection_for_named_view(detail_id: object, target_view: str) -> None:
+    def set_camera_projection_for_named_view(detail_id: object, target_view: str, defer_redraw: bool = False) -> None:
         """Set the camera projection of a Detail View to match the specified named view.
 
         Args:
             detail_id: Detail view object ID.
             target_view: Target named view (Top, Bottom, Front, Back, Left, or Right).
+            defer_redraw: Skip the view redraw so a batch of details can be redrawn once by the caller.
 
         Raises:
             CameraError: If detail is invalid or camera projection cannot be set.
@@ -307,40 +362,14 @@ class CameraTools:
 
         vp = rh_obj.Viewport
 
-        mapping = {
-            "Top": (
-                Rhino.Geometry.Vector3d(0, 0, -1),
-                Rhino.Geometry.Vector3d(0, 1, 0),
-            ),
-            "Bottom": (
-                Rhino.Geometry.Vector3d(0, 0, 1),
-                Rhino.Geometry.Vector3d(0, 1, 0),
-            ),
-            "Front": (
-                Rhino.Geometry.Vector3d(0, -1, 0),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-            "Back": (
-                Rhino.Geometry.Vector3d(0, 1, 0),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-            "Left": (
-                Rhino.Geometry.Vector3d(-1, 0, 0),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-            "Right": (
-                Rhino.Geometry.Vector3d(1, 0, 0),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-        }
-
-        if target_view not in mapping:
+        camera = _NAMED_VIEW_CAMERAS.get(target_view)
+        if camera is None:
             raise CameraError(
-                f"Invalid target view: '{target_view}'. Must be one of: {', '.join(mapping.keys())}",
+                f"Invalid target view: '{target_view}'. Must be one of: {', '.join(_NAMED_VIEW_CAMERAS)}",
                 context={"detail_id": detail_id, "target_view": target_view},
             )
 
-        direction, up = mapping[target_view]
+        direction, up = camera
         location = vp.CameraLocation
         target = location + direction
 
@@ -351,10 +380,11 @@ class CameraTools:
 
         rh_obj.CommitViewportChanges()
         rh_obj.CommitChanges()
-        sc.doc.Views.Redraw()
+        if not defer_redraw:
+            sc.doc.Views.Redraw()
 
     @staticmethod
-    def set_isometric_projection(detail_id: object, iso_type: str) -> None:
+    def set_isometric_projection(detail_id: object, iso_type: str, defer_redraw: bool = False) -> None:
         """Set detail view to isometric projection.
 
         Uses standard isometric angles: camera at 45° horizontal, 35.264° from horizontal plane.
@@ -363,6 +393,7 @@ class CameraTools:
         Args:
             detail_id: Detail view object ID.
             iso_type: "SW Isometric", "SE Isometric", "NE Isometric", or "NW Isometric".
+            defer_redraw: Skip the view redraw so a batch of details can be redrawn once by the caller.
 
         Raises:
             CameraError: If detail is invalid or iso_type is not recognized.
@@ -375,33 +406,14 @@ class CameraTools:
 
         vp = rh_obj.Viewport
 
-        mapping = {
-            "SW Isometric": (
-                Rhino.Geometry.Vector3d(-1, -1, 1),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-            "SE Isometric": (
-                Rhino.Geometry.Vector3d(1, -1, 1),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-            "NE Isometric": (
-                Rhino.Geometry.Vector3d(1, 1, 1),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-            "NW Isometric": (
-                Rhino.Geometry.Vector3d(-1, 1, 1),
-                Rhino.Geometry.Vector3d(0, 0, 1),
-            ),
-        }
-
-        if iso_type not in mapping:
+        camera = _ISOMETRIC_CAMERAS.get(iso_type)
+        if camera is None:
             raise CameraError(
-                f"Invalid isometric type: '{iso_type}'. Must be one of: {', '.join(mapping.keys())}",
+                f"Invalid isometric type: '{iso_type}'. Must be one of: {', '.join(_ISOMETRIC_CAMERAS)}",
                 context={"detail_id": detail_id, "iso_type": iso_type},
             )
 
-        direction, up = mapping[iso_type]
-        direction.Unitize()
+        direction, up = camera
         location = vp.CameraLocation
         target = location + direction
 
@@ -412,4 +424,5 @@ class CameraTools:
 
         rh_obj.CommitViewportChanges()
         rh_obj.CommitChanges()
-        sc.doc.Views.Redraw()
+        if not defer_redraw:
+            sc.doc.Views.Redraw()
@@ -21,6 +21,8 @@ Exception Handling:
 from __future__ import annotations
 
 import traceback
+from collections.abc import Generator
+from contextlib import contextmanager, nullcontext
 from functools import wraps
 from typing import Any, Callable
 
@@ -41,6 +43,45 @@ from .exceptions import (
 )
 
 
+# --- Exception Groups -----------------------------------------------------
+# Resolved once so each except clause matches against a ready-made tuple.
+ALERT_ERRORS = (ValidationError, DetailError, LayoutError, EnvironmentError, ScaleError)
+PRINT_ERRORS = (CameraError, TransformError)
+UNEXPECTED_ERRORS = (RuntimeError, ValueError, TypeError, AttributeError, ImportError, OSError)
+
+
+# --- Undo Recording -------------------------------------------------------
+# Nesting depth of open undo_block scopes; only the outermost one owns a record.
+_undo_state = {"depth": 0}
+
+
+@contextmanager
+def undo_block(description: str) -> Generator[None, None, None]:
+    """Group document changes under a single undo record.
+
+    Blocks nest: a block opened while another is active joins the outer
+    record instead of starting its own, so chained commands and batch helpers
+    produce one undo step.
+
+    Args:
+        description: Description for the undo record shown in Rhino's undo list.
+
+    Example:
+        >>> with undo_block("Batch Update Details"):
+        ...     for detail_id in detail_ids:
+        ...         update_detail(detail_id)
+    """
+    depth = _undo_state["depth"]
+    undo_record = sc.doc.BeginUndoRecord(description) if depth == 0 else None
+    _undo_state["depth"] = depth + 1
+    try:
+        yield
+    finally:
+        _undo_state["depth"] = depth
+        if undo_record is not None:
+            sc.doc.EndUndoRecord(undo_record)
+
+
 def rhino_command(
     requires_layout: bool = True,
     undo_description: str | None = None,
@@ -88,45 +129,44 @@ def rhino_command(
     """
 
     def decorator(func: Callable[..., None]) -> Callable[..., int]:
+        command_name = func.__name__.replace("_", " ").title()
+        start_message = Strings.MSG_SCRIPT_STARTED.format(command_name)
+
         @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> int:  # noqa: PLR0911, PLR0912
+        def wrapper(*args: Any, **kwargs: Any) -> int:  # noqa: PLR0911
             # Print start message
             if print_start:
-                command_name = func.__name__.replace("_", " ").title()
-                print(f"\n=== {command_name} Script Started ===")
-
-            # Pre-validation
-            try:
-                if requires_layout and not CommonUtils.is_layout_view_active():
-                    raise LayoutError(Strings.MSG_LAYOUT_VIEW_REQUIRED)
+                print(start_message)
 
-            except DocsPluginError as e:
-                CommonUtils.alert_user(str(e))
+            # Pre-validation (skipped outright for commands that run in any view)
+            if requires_layout and not CommonUtils.is_layout_view_active():
+                CommonUtils.alert_user(Strings.MSG_LAYOUT_VIEW_REQUIRED)
                 return 1
 
-            # Undo record management
-            undo_record = None
-            if undo_description:
-                undo_record = sc.doc.BeginUndoRecord(undo_description)
+            redraw = auto_redraw
+            was_modified = sc.doc.Modified
 
             try:
-                # Execute the command
-                func(*args, **kwargs)
+                # Execute the command, inside an undo record when requested
+                with undo_block(undo_description) if undo_description else nullcontext():
+                    func(*args, **kwargs)
 
                 # Print completion message
                 if print_end:
-                    print("=== Script Completed ===\n")
+                    print(Strings.MSG_SCRIPT_COMPLETED)
                 return 0  # Success # noqa: TRY300
 
             except UserCancelledError:
-                print("Operation cancelled by user.")
+                # A cancel that left a clean document untouched has nothing new to repaint
+                redraw = redraw and (was_modified or sc.doc.Modified)
+                print(Strings.MSG_OPERATION_CANCELLED)
                 return 0  # User cancellation is not an error
 
-            except (ValidationError, DetailError, LayoutError, EnvironmentError, ScaleError) as e:
+            except ALERT_ERRORS as e:
                 CommonUtils.alert_user(str(e))
                 return 1
 
-            except (CameraError, TransformError) as e:
+            except PRINT_ERRORS as e:
                 print(f"Operation failed: {e}")
                 return 1
 
@@ -134,7 +174,7 @@ def rhino_command(
                 CommonUtils.alert_user(f"Plugin error: {e}")
                 return 1
 
-            except (RuntimeError, ValueError, TypeError, AttributeError, ImportError, OSError) as e:
+            except UNEXPECTED_ERRORS as e:
                 print(f"Unexpected error: {e}")
                 print("Stack trace:")
                 traceback.print_exc()
@@ -142,10 +182,7 @@ def rhino_command(
 
             finally:
                 # Cleanup
-                if undo_record is not None:
-                    sc.doc.EndUndoRecord(undo_record)
-
-                if auto_redraw:
+                if redraw:
                     sc.doc.Views.Redraw()
 
         return wrapper
@@ -199,11 +236,8 @@ def safe_undo_block(description: str) -> Callable[[Callable[..., Any]], Callable
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            undo_record = sc.doc.BeginUndoRecord(description)
-            try:
+            with undo_block(description):
                 return func(*args, **kwargs)
-            finally:
-                sc.doc.EndUndoRecord(undo_record)
 
         return wrapper
 
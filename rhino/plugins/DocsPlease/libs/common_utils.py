@@ -13,6 +13,9 @@ Shared utility functions and validation logic
 from __future__ import annotations
 
 import re
+from collections.abc import Collection, Generator
+from contextlib import contextmanager
+from typing import Any
 
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
@@ -23,6 +26,10 @@ from .constants import Strings
 from .exceptions import DetailError, EnvironmentError, UserCancelledError  # noqa: A004
 
 
+_DetailViewObject = Rhino.DocObjects.DetailViewObject
+_RhinoPageView = Rhino.Display.RhinoPageView
+
+
 # --- Common Utilities -----------------------------------------------------
 class CommonUtils:
     """Shared utility functions for Rhino plugin operations."""
@@ -43,8 +50,7 @@ class CommonUtils:
         Returns:
             True if active view is a layout view, False otherwise.
         """
-        view = sc.doc.Views.ActiveView
-        return isinstance(view, Rhino.Display.RhinoPageView)
+        return isinstance(sc.doc.Views.ActiveView, _RhinoPageView)
 
     @staticmethod
     def get_model_unit_system() -> Rhino.UnitSystem:
@@ -56,8 +62,29 @@ class CommonUtils:
         return sc.doc.ModelUnitSystem
 
 
+# --- Redraw Control -------------------------------------------------------
+@contextmanager
+def suppress_redraw() -> Generator[None, None, None]:
+    """Disable view repaints for the duration of the block, then redraw once.
+
+    Batch edits otherwise repaint every view after each rhinoscriptsyntax call.
+    The previous RedrawEnabled state is restored, and the single redraw is only
+    issued if repaints were enabled to begin with, so blocks nest safely.
+    """
+    views = sc.doc.Views
+    redraw_enabled = views.RedrawEnabled
+    views.RedrawEnabled = False
+    try:
+        yield
+    finally:
+        views.RedrawEnabled = redraw_enabled
+        if redraw_enabled:
+            views.Redraw()
+
+
 # --- Validation Helpers ---------------------------------------------------
 SHEET_NUM_PATTERN = re.compile(r"^\d+\.\d+$")  # e.g. "1.2", "101.03"
+_match_sheet_number = SHEET_NUM_PATTERN.match
 
 
 def validate_sheet_number(number: str) -> bool:
@@ -69,7 +96,7 @@ def validate_sheet_number(number: str) -> bool:
     Returns:
         True if number matches pattern (e.g., "1.2", "101.03"), False otherwise.
     """
-    return bool(SHEET_NUM_PATTERN.match(str(number)))
+    return _match_sheet_number(str(number)) is not None
 
 
 # --- Validation Functions with Exceptions --------------------------------
@@ -87,11 +114,23 @@ def validate_detail_object(detail_id: object) -> Rhino.DocObjects.DetailViewObje
     """
 
     rh_obj = rs.coercerhinoobject(detail_id)
-    if not rh_obj or not isinstance(rh_obj, Rhino.DocObjects.DetailViewObject):
+    if not isinstance(rh_obj, _DetailViewObject):
         raise DetailError(Strings.MSG_INVALID_DETAIL_SELECTED)
     return rh_obj
 
 
+def get_selected_detail_ids() -> list[Any]:
+    """Return the IDs of currently selected Detail Views.
+
+    Walks the selected objects once and type-checks them directly, rather than
+    resolving each ID again through rs.IsDetail.
+
+    Returns:
+        List of selected detail view GUIDs (empty if none are selected).
+    """
+    return [obj.Id for obj in sc.doc.Objects.GetSelectedObjects(False, False) if isinstance(obj, _DetailViewObject)]
+
+
 def require_user_selection(prompt: str, filter_type: int) -> object:
     """Get user selection or raise UserCancelledError.
 
@@ -152,7 +191,7 @@ def require_user_string(prompt: str, default: str = "", title: str = "Input", al
         raise UserCancelledError("String input cancelled")
 
     result = result.strip()
-    if not allow_empty and not result:
+    if not (result or allow_empty):
         raise UserCancelledError("Empty input not allowed")
 
     return result
@@ -179,11 +218,14 @@ def require_user_choice(options: list[str], prompt: str, title: str = "Select")
     return choice
 
 
-def validate_environment_units(supported_units: list[Rhino.UnitSystem]) -> None:
+def validate_environment_units(supported_units: Collection[Rhino.UnitSystem]) -> Rhino.UnitSystem:
     """Validate that current model units are supported.
 
     Args:
-        supported_units: List of supported unit systems.
+        supported_units: Supported unit systems; pass a set (e.g. Constants.SUPPORTED_UNIT_SYSTEMS) for O(1) lookup.
+
+    Returns:
+        The current model unit system, so callers need not query it again.
 
     Raises:
         EnvironmentError: If current units are not supported.
@@ -192,3 +234,4 @@ def validate_environment_units(supported_units: list[Rhino.UnitSystem]) -> None:
     current_units = CommonUtils.get_model_unit_system()
     if current_units not in supported_units:
         raise EnvironmentError(Strings.MSG_UNSUPPORTED_UNIT_SYSTEM)
+    return current_units
@@ -32,12 +32,9 @@ class Constants:
     SCALE_NA_LABEL = "SCALE: N/A"
 
     # Unit System Support
-    SUPPORTED_UNIT_SYSTEMS: ClassVar[list[Any]] = [
-        Rhino.UnitSystem.Inches,
-        Rhino.UnitSystem.Feet,
-        Rhino.UnitSystem.Millimeters,
-        Rhino.UnitSystem.Meters,
-    ]
+    IMPERIAL_UNIT_SYSTEMS: ClassVar[frozenset[Any]] = frozenset({Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet})
+    METRIC_UNIT_SYSTEMS: ClassVar[frozenset[Any]] = frozenset({Rhino.UnitSystem.Millimeters, Rhino.UnitSystem.Meters})
+    SUPPORTED_UNIT_SYSTEMS: ClassVar[frozenset[Any]] = IMPERIAL_UNIT_SYSTEMS | METRIC_UNIT_SYSTEMS
 
     # Tolerances
     TOLERANCE = 1e-6
@@ -119,6 +116,19 @@ class Constants:
         "SCALE: 1:1000": 1000.0,
     }
 
+    ARCHITECTURAL_SCALES_METRIC_ORDER: ClassVar[list[str]] = [
+        "SCALE: 1:1",
+        "SCALE: 1:2",
+        "SCALE: 1:5",
+        "SCALE: 1:10",
+        "SCALE: 1:20",
+        "SCALE: 1:50",
+        "SCALE: 1:100",
+        "SCALE: 1:200",
+        "SCALE: 1:500",
+        "SCALE: 1:1000",
+    ]
+
     # --- Project Templates ------------------------------------------------
     PROJECT_TEMPLATES: ClassVar[dict[str, dict[str, Any]]] = {
         "Full AEC": {
@@ -168,20 +178,24 @@ class Metadata:
     SCALE_INHERITED = "meta_scale_inherited"
 
     @classmethod
-    def all(cls) -> list[str]:
+    def all(cls) -> tuple[str, ...]:
         """Return all metadata key values.
 
         Returns:
-            List of all metadata key strings.
+            Tuple of all metadata key strings, in declaration order (collected once at import).
         """
-        return [v for k, v in cls.__dict__.items() if k.isupper()]
+        return METADATA_KEYS
+
+
+# Frozen once at import: ordered keys for iteration
+METADATA_KEYS = tuple(v for k, v in vars(Metadata).items() if k.isupper())
 
 
 # --- Designation Level (L1 / L2) ------------------------------------------
-DESIGNATION_LEVEL_CHOICES = [("L1", "Level 1"), ("L2", "Level 2")]
+DESIGNATION_LEVEL_CHOICES = (("L1", "Level 1"), ("L2", "Level 2"))
 
 # --- L1 Disciplines -------------------------------------------------------
-DISCIPLINE_CHOICES = [
+DISCIPLINE_CHOICES = (
     ("A", "Architectural"),
     ("B", "Geotechnical"),
     ("C", "Civil"),
@@ -203,7 +217,7 @@ DISCIPLINE_CHOICES = [
     ("W", "Distributed Energy"),
     ("X", "Other Disciplines"),
     ("Z", "Contractor / Shop Drawings"),
-]
+)
 
 # --- L2 sub-discipline map ------------------------------------------------
 L2_CHOICES_BY_MASTER = {
@@ -360,6 +374,10 @@ L2_CHOICES_BY_MASTER = {
     ],
 }
 
+# Flat indexes over the L2 map: code -> (short, long) names, and code -> master (L1) discipline
+L2_CODE_INDEX = {code: (short, long) for entries in L2_CHOICES_BY_MASTER.values() for code, short, long in entries}
+L2_MASTER_BY_CODE = {code: master for master, entries in L2_CHOICES_BY_MASTER.items() for code, _, _ in entries}
+
 
 # --- Strings Section ------------------------------------------------------
 class Strings:
@@ -372,7 +390,7 @@ class Strings:
     PROMPT_PICK_CHILD_POINT = "Pick CHILD Matching Point"
     PROMPT_DIRECTION = "Direction"
     DEFAULT_DIRECTION = "Vertical"
-    DIRECTION_OPTIONS: ClassVar[list[str]] = ["Horizontal", "Vertical"]
+    DIRECTION_OPTIONS: ClassVar[tuple[str, ...]] = ("Horizontal", "Vertical")
     MSG_PARENT_CHILD_SAME = "Parent and Child details cannot be the same."
     MSG_INVALID_ALIGNMENT = "Invalid alignment choice."
     MSG_INVALID_DETAIL_SELECTED = "Invalid object selected. Please select a Detail View."
@@ -409,33 +427,32 @@ class Strings:
     MSG_PAGE_SCALE_NOT_RECOGNIZED = "Stored Page Scale not recognized. Please reset Page Scale."
     MSG_DETAIL_SET_TO_SCALE = "Detail '{}' set to Scale: {}."
 
-    # Architectural Scale Prompting
-    PROMPT_ARCHITECTURAL_DETAIL_SCALES = "Architectural Detail Scales"
-    OPTIONS_ARCHITECTURAL_OPERATIONS: ClassVar[list[str]] = [
-        "Set to Custom Scale",
-        "Set to Page Scale",
-        "Batch Custom Scale",
-        "Batch Page Scale",
-    ]
-
-    # Engineering Scale Prompting
-    PROMPT_ENGINEERING_DETAIL_SCALES = "Engineering Detail Scales"
-    OPTIONS_ENGINEERING_OPERATIONS: ClassVar[list[str]] = [
-        "Set to Custom Scale",
-        "Set to Page Scale",
-        "Batch Custom Scale",
-        "Batch Page Scale",
-    ]
-
     # Operation Keywords (Shared)
     OP_SET_TO_CUSTOM_SCALE = "Set to Custom Scale"
     OP_SET_TO_PAGE_SCALE = "Set to Page Scale"
     OP_BATCH_CUSTOM_SCALE = "Batch Custom Scale"
     OP_BATCH_PAGE_SCALE = "Batch Page Scale"
+    _SCALE_OPERATIONS: ClassVar[tuple[str, ...]] = (
+        OP_SET_TO_CUSTOM_SCALE,
+        OP_SET_TO_PAGE_SCALE,
+        OP_BATCH_CUSTOM_SCALE,
+        OP_BATCH_PAGE_SCALE,
+    )
+
+    # Architectural Scale Prompting
+    PROMPT_ARCHITECTURAL_DETAIL_SCALES = "Architectural Detail Scales"
+    OPTIONS_ARCHITECTURAL_OPERATIONS: ClassVar[tuple[str, ...]] = _SCALE_OPERATIONS
+
+    # Engineering Scale Prompting
+    PROMPT_ENGINEERING_DETAIL_SCALES = "Engineering Detail Scales"
+    OPTIONS_ENGINEERING_OPERATIONS: ClassVar[tuple[str, ...]] = _SCALE_OPERATIONS
 
     # General UX & Errors
     MSG_LAYOUT_VIEW_REQUIRED = "This script must be run in a Layout (Page) View."
     MSG_UNSUPPORTED_UNIT_SYSTEM = "This unit system is not currently supported."
+    MSG_SCRIPT_STARTED = "\n=== {} Script Started ==="
+    MSG_SCRIPT_COMPLETED = "=== Script Completed ===\n"
+    MSG_OPERATION_CANCELLED = "Operation cancelled by user."
 
     # Ortho Detail From Detail
     STEP1_PROMPT_SELECT_DETAIL = "Select a Detail View"
@@ -12,20 +12,64 @@ All detail view manipulation, scaling, and geometry operations
 
 from __future__ import annotations
 
+import math
 from typing import Any
 
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
+import System
 
 import Rhino
 
-from .common_utils import CommonUtils
+from .command_framework import undo_block
+from .common_utils import CommonUtils, get_selected_detail_ids, suppress_redraw
 from .constants import Constants
 from .exceptions import DetailError, ScaleError, UserCancelledError, ValidationError
 
 
+_Point2d = Rhino.Geometry.Point2d
+# Caption text heights in page units (number, title, scale); find_existing_caption tells the
+# grouped elements apart by height, so both sides read the same values
+CAPTION_TEXT_HEIGHTS = (0.6, 0.3, 0.15)
+CAPTION_HEIGHT_TOLERANCE = 0.01
+# Curly quotes typed into scale labels -> the straight quotes the scale tables use
+_SMART_QUOTES = str.maketrans({"\u201c": '"', "\u201d": '"', "\u2018": "'", "\u2019": "'"})
+
+
+# --- Scale Label Lookup ---------------------------------------------------
+# Scale tables store ratios to 4 decimals (e.g. 0.3333 for 3" = 1'-0"), so live ratios are rounded
+# to the same precision and resolved with one dict lookup instead of a tolerance scan.
+SCALE_RATIO_DIGITS = 4
+IMPERIAL_LABEL_BY_RATIO = {
+    round(ratio, SCALE_RATIO_DIGITS): label for label, ratio in Constants.ARCHITECTURAL_SCALES_IMPERIAL.items()
+}
+METRIC_LABEL_BY_RATIO = {
+    round(ratio, SCALE_RATIO_DIGITS): label for label, ratio in Constants.ARCHITECTURAL_SCALES_METRIC.items()
+}
+
+# Unit system -> architectural scale table / ratio index, so callers dispatch with one lookup
+SCALES_BY_UNIT = {
+    **dict.fromkeys(Constants.IMPERIAL_UNIT_SYSTEMS, Constants.ARCHITECTURAL_SCALES_IMPERIAL),
+    **dict.fromkeys(Constants.METRIC_UNIT_SYSTEMS, Constants.ARCHITECTURAL_SCALES_METRIC),
+}
+LABEL_BY_RATIO_BY_UNIT = {
+    **dict.fromkeys(Constants.IMPERIAL_UNIT_SYSTEMS, IMPERIAL_LABEL_BY_RATIO),
+    **dict.fromkeys(Constants.METRIC_UNIT_SYSTEMS, METRIC_LABEL_BY_RATIO),
+}
+
+# (mode, unit system) -> (display order, scale table) for select_scale
+_ARCHITECTURAL_IMPERIAL = (Constants.ARCHITECTURAL_SCALES_IMPERIAL_ORDER, Constants.ARCHITECTURAL_SCALES_IMPERIAL)
+_ARCHITECTURAL_METRIC = (Constants.ARCHITECTURAL_SCALES_METRIC_ORDER, Constants.ARCHITECTURAL_SCALES_METRIC)
+_ENGINEERING_IMPERIAL = (Constants.ENGINEERING_SCALES_IMPERIAL_ORDER, Constants.ENGINEERING_SCALES_IMPERIAL)
+_MODE_TABLE = {
+    **{("Architectural", units): _ARCHITECTURAL_IMPERIAL for units in Constants.IMPERIAL_UNIT_SYSTEMS},
+    **{("Architectural", units): _ARCHITECTURAL_METRIC for units in Constants.METRIC_UNIT_SYSTEMS},
+    **{("Engineering", units): _ENGINEERING_IMPERIAL for units in Constants.IMPERIAL_UNIT_SYSTEMS},
+}
+
+
 # --- Detail Tools ---------------------------------------------------------
-class DetailTools:
+class DetailTools:  # noqa: PLR0904
     """Tools for detail view manipulation, scaling, and geometry operations."""
 
     @staticmethod
@@ -35,23 +79,19 @@ class DetailTools:
         Returns:
             Dictionary mapping scale labels to scale ratios.
         """
-        units = CommonUtils.get_model_unit_system()
-        if units in {Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet}:
-            return Constants.ARCHITECTURAL_SCALES_IMPERIAL
-        if units in {Rhino.UnitSystem.Millimeters, Rhino.UnitSystem.Meters}:
-            return Constants.ARCHITECTURAL_SCALES_METRIC
-        return {}
+        return SCALES_BY_UNIT.get(CommonUtils.get_model_unit_system(), {})
 
     @staticmethod
     def select_scale(
-        scale_dict: dict[str, float],
+        scale_dict: dict[str, float] | None = None,
         mode: str = "Architectural",
         title: str = "Select a Scale",
     ) -> tuple[float, float, str]:
         """Present a ListBox of available scales in correct order based on the mode provided.
 
         Args:
-            scale_dict: Dictionary of scale labels to ratios.
+            scale_dict: Optional legacy override of the scale table. By default the table is
+                        resolved from the mode and the model units.
             mode: Scale mode ("Architectural" or "Engineering").
             title: Dialog title.
 
@@ -62,15 +102,14 @@ class DetailTools:
             UserCancelledError: If user cancels scale selection.
             ScaleError: If no scales are available or scale value not found.
         """
-        if mode == "Architectural":
-            keys = Constants.ARCHITECTURAL_SCALES_IMPERIAL_ORDER
-        elif mode == "Engineering":
-            keys = Constants.ENGINEERING_SCALES_IMPERIAL_ORDER
+        entry = _MODE_TABLE.get((mode, CommonUtils.get_model_unit_system()))
+        if scale_dict is None and entry is not None:
+            keys, scale_dict = entry
+        elif scale_dict:
+            # A passed-in table keeps the mode's display order only if it is that same table
+            keys = entry[0] if entry is not None and entry[1] is scale_dict else sorted(scale_dict)
         else:
-            keys = sorted(scale_dict.keys()) if scale_dict else []
-
-        if not keys:
-            raise ScaleError("No scale keys available for selection")
+            raise ScaleError("No scale keys available for selection", context={"mode": mode})
 
         choice = rs.ListBox(keys, title, title)
         if not choice:
@@ -96,24 +135,58 @@ class DetailTools:
         Raises:
             ScaleError: If scale operation fails or metadata cannot be set.
         """
-        success = rs.DetailScale(detail_id, page_length=page_length, model_length=model_length)
-        if not success:
+        rh_obj = rs.coercerhinoobject(detail_id)
+        if not isinstance(rh_obj, Rhino.DocObjects.DetailViewObject):
+            raise ScaleError("Could not coerce detail to Rhino object", context={"detail_id": detail_id})
+
+        # Re-applying the scale a detail already has (e.g. rerunning a batch) would only redraw it again
+        detail = rh_obj.DetailGeometry
+        attrs = rh_obj.Attributes
+        if (
+            attrs.GetUserString("detail_scale") == scale_label
+            and abs(detail.PageToModelRatio - page_length / model_length) < Constants.TOLERANCE
+        ):
+            return
+
+        # Same call rs.DetailScale makes, minus its second coercion and per-detail view redraw
+        doc = sc.doc
+        if not detail.SetScale(model_length, doc.ModelUnitSystem, page_length, doc.PageUnitSystem):
             raise ScaleError(
                 "Failed to set detail scale",
                 context={"detail_id": detail_id, "page_length": page_length, "model_length": model_length},
             )
 
-        rh_obj = rs.coercerhinoobject(detail_id)
-        if not rh_obj or not isinstance(rh_obj, Rhino.DocObjects.DetailViewObject):
-            raise ScaleError("Could not coerce detail to Rhino object after scaling", context={"detail_id": detail_id})
-
         try:
-            rh_obj.Attributes.SetUserString("detail_scale", scale_label)
+            attrs.SetUserString("detail_scale", scale_label)
         except (AttributeError, RuntimeError) as e:
             raise ScaleError(
                 f"Failed to set user string for detail: {e}",
                 context={"detail_id": detail_id, "scale_label": scale_label},
             )
+        rh_obj.CommitChanges()
+
+    @staticmethod
+    def set_details_scale(detail_ids: list[Any], page_length: float, model_length: float, scale_label: str) -> int:
+        """Apply one scale to several detail views with a single redraw.
+
+        Repaints are suppressed for the batch and issued once when it finishes.
+
+        Args:
+            detail_ids: Detail view object IDs.
+            page_length: Page length for scale ratio.
+            model_length: Model length for scale ratio.
+            scale_label: Human-readable scale label.
+
+        Returns:
+            Number of detail views scaled.
+
+        Raises:
+            ScaleError: If any scale operation fails or metadata cannot be set.
+        """
+        with suppress_redraw():
+            for detail_id in detail_ids:
+                DetailTools.set_detail_scale(detail_id, page_length, model_length, scale_label)
+        return len(detail_ids)
 
     @staticmethod
     def format_architectural_scale(page_length: float, model_length: float) -> str:
@@ -123,34 +196,45 @@ class DetailTools:
         scale string (e.g., "SCALE: 1/4" = 1'-0"") based on model units.
 
         Args:
-            page_length: Page length for scale ratio (typically 1.0).
-            model_length: Model length for scale ratio.
+            page_length: Length in page units.
+            model_length: Length in model units.
 
         Returns:
             Formatted scale string, or "SCALE: Custom" if non-standard.
         """
-        if model_length <= 0.0:
+        if page_length <= 0.0 or model_length <= 0.0:
             return Constants.SCALE_NA_LABEL  # Handle division by zero or invalid length
 
-        ratio = model_length / page_length  # Calculate the model units per page unit
+        label_by_ratio = LABEL_BY_RATIO_BY_UNIT.get(CommonUtils.get_model_unit_system())
+        if label_by_ratio is None:
+            return "SCALE: Unsupported Units"
 
-        units = CommonUtils.get_model_unit_system()
-        scale_dict = {}
+        # Model units per page unit, rounded to the precision the scale tables are written in
+        return label_by_ratio.get(round(model_length / page_length, SCALE_RATIO_DIGITS), "SCALE: Custom")
 
-        if units in {Rhino.UnitSystem.Inches, Rhino.UnitSystem.Feet}:
-            scale_dict = Constants.ARCHITECTURAL_SCALES_IMPERIAL
-        elif units in {Rhino.UnitSystem.Millimeters, Rhino.UnitSystem.Meters}:
-            scale_dict = Constants.ARCHITECTURAL_SCALES_METRIC
-        else:
-            return "SCALE: Unsupported Units"
+    @staticmethod
+    def format_architectural_scale_for_detail(detail_obj: Rhino.DocObjects.DetailViewObject) -> str:
+        """Format the live scale of a Detail View into a standard architectural scale string.
 
-        for label, standard_ratio in scale_dict.items():
-            if abs(ratio - standard_ratio) < Constants.TOLERANCE:
-                return label  # Found a match, return the standard label
+        Args:
+            detail_obj: Detail view object.
 
-        return "SCALE: Custom"
+        Returns:
+            Formatted scale string, "SCALE: Custom" if non-standard, or Constants.SCALE_NA_LABEL
+            if the detail has no valid ratio.
+        """
+        ratio = detail_obj.DetailGeometry.PageToModelRatio
+        if not ratio or ratio <= 0.0:
+            return Constants.SCALE_NA_LABEL  # Handle division by zero or invalid ratio
+        return DetailTools.format_architectural_scale(1.0, 1.0 / ratio)
 
     # --- Metadata Storage -------------------------------------------------
+    @staticmethod
+    def _active_pageview() -> Rhino.Display.RhinoPageView | None:
+        """Return the active view if it is a Layout (Page) View, None otherwise."""
+        view = sc.doc.Views.ActiveView
+        return view if isinstance(view, Rhino.Display.RhinoPageView) else None
+
     @staticmethod
     def set_page_scale_metadata(scale_text: str) -> None:
         """Set 'page_scale' user string on the active Layout Page View.
@@ -158,15 +242,16 @@ class DetailTools:
         Args:
             scale_text: Scale text to store.
         """
-        pageview = sc.doc.Views.ActiveView
-        if isinstance(pageview, Rhino.Display.RhinoPageView):
-            vp = pageview.ActiveViewport
-            if vp:
-                vp.SetUserString("page_scale", scale_text)
-            else:
-                print("Warning: Could not access ActiveViewport for the PageView.")
-        else:
+        pageview = DetailTools._active_pageview()
+        if pageview is None:
             print("Warning: Not currently in a Layout (Page) View.")
+            return
+
+        vp = pageview.ActiveViewport
+        if vp:
+            vp.SetUserString("page_scale", scale_text)
+        else:
+            print("Warning: Could not access ActiveViewport for the PageView.")
 
     @staticmethod
     def get_page_scale_metadata() -> str | None:
@@ -175,29 +260,40 @@ class DetailTools:
         Returns:
             Scale text if found, None otherwise.
         """
-        pageview = sc.doc.Views.ActiveView
-        if isinstance(pageview, Rhino.Display.RhinoPageView):
-            vp = pageview.ActiveViewport
-            if vp:
-                return vp.GetUserString("page_scale")
-            print("Warning: Could not access ActiveViewport for the PageView.")
+        pageview = DetailTools._active_pageview()
+        if pageview is None:
+            return None
+
+        vp = pageview.ActiveViewport
+        if vp:
+            return vp.GetUserString("page_scale")
+        print("Warning: Could not access ActiveViewport for the PageView.")
         return None
 
     # --- Layer Management -------------------------------------------------
     @staticmethod
-    def ensure_layer_exists(layer_name: str, color: Any = None) -> None:
+    def ensure_layer_exists(layer_name: str, color: Any = None) -> int:
         """Ensure the specified layer exists with the given color.
 
         Args:
-            layer_name: Name of the layer to check or create.
+            layer_name: Full path of the layer to check or create.
             color: Optional color to assign if layer is created (System.Drawing.Color).
                   If None, uses default layer color.
+
+        Returns:
+            Index of the layer in the document layer table.
         """
-        if not rs.IsLayer(layer_name):
-            if color is not None:
-                rs.AddLayer(layer_name, color)
-            else:
-                rs.AddLayer(layer_name)
+        # Common case: one layer-table lookup, and the index is handed back for reuse
+        layers = sc.doc.Layers
+        layer_index = layers.FindByFullPath(layer_name, -1)
+        if layer_index >= 0:
+            return layer_index
+
+        if color is not None:
+            rs.AddLayer(layer_name, color)
+        else:
+            rs.AddLayer(layer_name)
+        return layers.FindByFullPath(layer_name, -1)
 
     # --- Detail Object Selection ------------------------------------------
     @staticmethod
@@ -213,11 +309,7 @@ class DetailTools:
         Raises:
             UserCancelledError: If no details are selected or user cancels selection.
         """
-        selected_ids = rs.SelectedObjects(include_lights=False, include_grips=False) if preselect_allowed else []
-        detail_ids: list[str] = []
-
-        if selected_ids:
-            detail_ids.extend(obj_id for obj_id in selected_ids if rs.IsDetail(obj_id))
+        detail_ids = get_selected_detail_ids() if preselect_allowed else []
 
         if not detail_ids:
             ids = rs.GetObjects("Select Detail Views", rs.filter.detail, preselect=False, select=True)
@@ -234,14 +326,17 @@ class DetailTools:
         Args:
             ids: List of detail view object IDs to select.
         """
-        rs.UnselectAllObjects()
-        if ids:
-            try:
-                rs.SelectObjects(ids)
-            except (AttributeError, RuntimeError) as e:
-                print(f"Error selecting objects: {e}")
-                print(f"IDs provided: {ids}")
-        sc.doc.Views.Redraw()
+        # Both selection calls repaint on their own; collapse them into one redraw
+        objects = sc.doc.Objects
+        with suppress_redraw():
+            objects.UnselectAll()
+            if ids:
+                try:
+                    # One bulk Select call instead of rs.SelectObjects validating and selecting per ID
+                    objects.Select(System.Collections.Generic.List[System.Guid](ids))
+                except (AttributeError, RuntimeError, TypeError) as e:
+                    print(f"Error selecting objects: {e}")
+                    print(f"IDs provided: {ids}")
 
     # --- Layout Geometry and Detail Creation ------------------------------
     @staticmethod
@@ -258,9 +353,8 @@ class DetailTools:
         if not rect:
             raise UserCancelledError("Rectangle selection cancelled")
 
-        pt1 = Rhino.Geometry.Point2d(rect[0].X, rect[0].Y)
-        pt2 = Rhino.Geometry.Point2d(rect[2].X, rect[2].Y)
-        return pt1, pt2
+        corner1, corner2 = rect[0], rect[2]
+        return _Point2d(corner1.X, corner1.Y), _Point2d(corner2.X, corner2.Y)
 
     @staticmethod
     def create_detail(pageview: Any, pt1: Any, pt2: Any, name: str = "Detail") -> Any:
@@ -306,15 +400,28 @@ class DetailTools:
 
         Returns:
             Number of detail views moved.
+
+        Raises:
+            ValidationError: If the target layer does not exist.
         """
-        moved_count = 0
         details = pageview.GetDetailViews()
-        for detail in details:
-            current_layer = rs.ObjectLayer(detail.Id)
-            if current_layer != target_layer:
-                rs.ObjectLayer(detail.Id, target_layer)
-                moved_count += 1
-        return moved_count
+        if not details:
+            return 0
+
+        doc = sc.doc
+        target_index = doc.Layers.FindByFullPath(target_layer, -1)
+        if target_index < 0:
+            raise ValidationError("Target layer not found", context={"layer": target_layer})
+
+        # Compare layer indices on the attributes; only misplaced details are written back
+        misplaced = [detail for detail in details if detail.Attributes.LayerIndex != target_index]
+        # One undo step for the whole page; joins the caller's record when run inside a command
+        with undo_block("Move Details to Layer"):
+            for detail in misplaced:
+                attributes = detail.Attributes.Duplicate()
+                attributes.LayerIndex = target_index
+                doc.Objects.ModifyAttributes(detail, attributes, True)
+        return len(misplaced)
 
     # --- Caption Management -----------------------------------------------
     @staticmethod
@@ -328,62 +435,63 @@ class DetailTools:
         Returns:
             tuple: (number_id, title_id, scale_id) if found, None otherwise.
         """
-        # Get all objects on the caption layer
-        objs = rs.ObjectsByLayer(Constants.CAPTION_LAYER)
+        doc = sc.doc
+        layer_index = doc.Layers.FindByFullPath(Constants.CAPTION_LAYER, -1)
+        if layer_index < 0:
+            return None
+
+        # Work on the RhinoObjects themselves rather than re-coercing each GUID through rs
+        objs = doc.Objects.FindByLayer(doc.Layers.FindIndex(layer_index))
         if not objs:
             return None
 
         # Convert detail_id to string for comparison
         detail_id_str = str(detail_id)
+        text_type = Rhino.DocObjects.TextObject
+        number_height, title_height, _ = CAPTION_TEXT_HEIGHTS
 
         # Search for text objects with matching metadata
-        for obj in objs:
-            if not rs.IsText(obj):
+        for rh_obj in objs:
+            if not isinstance(rh_obj, text_type):
                 continue
 
             # Check if this is a DetailCaption with matching linked_detail_id
-            caption_type = rs.GetUserText(obj, "caption_type")
-            linked_detail = rs.GetUserText(obj, "linked_detail_id")
-
-            if caption_type == "DetailCaption" and linked_detail == detail_id_str:
-                # Found the scale text element with metadata
-                scale_id = obj
-
-                # Get the group(s) this object belongs to
-                groups = rs.ObjectGroups(scale_id)
-                if not groups:
-                    # Metadata exists but no group structure - incomplete caption
-                    continue
+            attrs = rh_obj.Attributes
+            if (
+                attrs.GetUserString("caption_type") != "DetailCaption"
+                or attrs.GetUserString("linked_detail_id") != detail_id_str
+            ):
+                continue
 
-                # Get all objects in the first group (should be the DetailCaption group)
-                group_objects = rs.GroupObjects(groups[0])
-                if not group_objects or len(group_objects) < 3:
-                    # Incomplete group structure
-                    continue
+            # Get the group(s) this object belongs to
+            groups = attrs.GetGroupList()
+            if not groups:
+                # Metadata exists but no group structure - incomplete caption
+                continue
 
-                # Identify number, title, and scale text objects
-                # Number text has height 0.6, title has 0.3, scale has 0.15
-                number_id = None
-                title_id = None
+            # Get all objects in the first group (should be the DetailCaption group)
+            group_objects = doc.Objects.FindByGroup(groups[0])
+            if not group_objects or len(group_objects) < 3:
+                # Incomplete group structure
+                continue
 
-                for group_obj in group_objects:
-                    if not rs.IsText(group_obj):
-                        continue
+            # Identify number and title text objects by their caption text heights
+            number_id = None
+            title_id = None
 
-                    # Get text height to identify the element
-                    text_obj = rs.coercerhinoobject(group_obj)
-                    if text_obj and hasattr(text_obj.Geometry, "TextHeight"):
-                        height = text_obj.Geometry.TextHeight
+            for group_obj in group_objects:
+                if not isinstance(group_obj, text_type):
+                    continue
 
-                        # Use tolerance for floating point comparison
-                        if abs(height - 0.6) < 0.01:
-                            number_id = group_obj
-                        elif abs(height - 0.3) < 0.01:
-                            title_id = group_obj
+                height = group_obj.Geometry.TextHeight
+                if math.isclose(height, number_height, abs_tol=CAPTION_HEIGHT_TOLERANCE):
+                    number_id = group_obj.Id
+                elif math.isclose(height, title_height, abs_tol=CAPTION_HEIGHT_TOLERANCE):
+                    title_id = group_obj.Id
 
-                # Verify we found all three elements
-                if number_id and title_id and scale_id:
-                    return (number_id, title_id, scale_id)
+            # Verify we found all three elements
+            if number_id is not None and title_id is not None:
+                return (number_id, title_id, rh_obj.Id)
 
         return None
 
@@ -409,14 +517,24 @@ class DetailTools:
         Returns:
             int: Number of Detail Captions found on the caption layer.
         """
-        objs = rs.ObjectsByLayer(Constants.CAPTION_LAYER)
-        count = 0
-        if objs:
-            for obj in objs:
-                rh_obj = rs.coercerhinoobject(obj)
-                if rh_obj and rs.IsText(rh_obj.Id) and rs.GetUserText(rh_obj.Id, "caption_type") == "DetailCaption":
-                    count += 1
-        return count
+        doc = sc.doc
+        layer_index = doc.Layers.FindByFullPath(Constants.CAPTION_LAYER, -1)
+        if layer_index < 0:
+            return 0
+
+        # Layer-indexed lookup only visits objects on the caption layer
+        objs = doc.Objects.FindByLayer(doc.Layers.FindIndex(layer_index))
+        if not objs:
+            return 0
+
+        text_type = Rhino.DocObjects.TextObject
+        type_key = "caption_type"
+        caption_type = "DetailCaption"
+        return sum(
+            1
+            for rh_obj in objs
+            if isinstance(rh_obj, text_type) and rh_obj.Attributes.GetUserString(type_key) == caption_type
+        )
 
     @staticmethod
     def get_detail_scale(detail_id: object) -> str:
@@ -435,14 +553,10 @@ class DetailTools:
             scale_text = rh_obj.Attributes.GetUserString("detail_scale")
             if scale_text:
                 # Normalize smart quotes if necessary
-                scale_text = scale_text.replace(""", '"').replace(""", '"')
-                scale_text = scale_text.replace("'", "'").replace("'", "'")
-                return scale_text.strip()
+                return scale_text.translate(_SMART_QUOTES).strip()
 
             # If no user text, fallback to live PageToModelRatio
-            ratio = getattr(rh_obj.DetailGeometry, "PageToModelRatio", None)
-            if ratio and ratio > 0.0:
-                return DetailTools.format_architectural_scale(1.0, 1.0 / ratio)
+            return DetailTools.format_architectural_scale_for_detail(rh_obj)
 
         return Constants.SCALE_NA_LABEL
 
@@ -507,58 +621,71 @@ class DetailTools:
                 context={"detail_id": detail_id},
             )
 
-        bbox = rh_detail.Geometry.GetBoundingBox(sc.doc.Views.ActiveView.ActiveViewport.ConstructionPlane())
+        # Layout pages use a WorldXY construction plane, so the world-aligned box frames the detail
+        bbox = rh_detail.Geometry.GetBoundingBox(True)
         center_x = (bbox.Min.X + bbox.Max.X) / 2.0
         base_y = bbox.Min.Y - 0.15  # Offset below detail
 
-        # Create text objects
-        number_id = rs.AddText(str(number), (0, 0, 0), 0.6)
-        title_id = rs.AddText(title, (0, 0, 0), 0.3)
-        scale_id = rs.AddText(scale, (0, 0, 0), 0.15)
-
-        if not all([number_id, title_id, scale_id]):
-            raise ValidationError("Failed to create one or more caption text elements")
-
-        # Move to caption layer
-        rs.ObjectLayer(number_id, Constants.CAPTION_LAYER)
-        rs.ObjectLayer(title_id, Constants.CAPTION_LAYER)
-        rs.ObjectLayer(scale_id, Constants.CAPTION_LAYER)
+        # Build the text in memory so it can be measured and placed before it touches the document
+        plane = Rhino.Geometry.Plane.WorldXY
+        dim_style = sc.doc.DimStyles.Current
+        entities = []
+        for text, height in zip((str(number), title, scale), CAPTION_TEXT_HEIGHTS):
+            entity = Rhino.Geometry.TextEntity.Create(text, plane, dim_style, False, 0, 0)
+            if entity is None:
+                raise ValidationError("Failed to create one or more caption text elements")
+            entity.TextHeight = height
+            entities.append(entity)
+        number_te, title_te, scale_te = entities
 
         # Position title and scale relative to number
-        bbox_number = rs.BoundingBox(number_id)
-        width_number = bbox_number[1][0] - bbox_number[0][0]
-
-        title_offset = (width_number + 0.1, 0.075, 0)
-        scale_offset = (width_number + 0.1, -(0.15 + 0.075), 0)
+        bbox_number = number_te.GetBoundingBox(True)
+        width_number = bbox_number.Max.X - bbox_number.Min.X
 
-        rs.MoveObject(title_id, title_offset)
-        rs.MoveObject(scale_id, scale_offset)
+        title_te.Translate(Rhino.Geometry.Vector3d(width_number + 0.1, 0.075, 0))
+        scale_te.Translate(Rhino.Geometry.Vector3d(width_number + 0.1, -(0.15 + 0.075), 0))
 
-        # Center the group under the detail
-        temp_group = rs.AddGroup()
-        rs.AddObjectsToGroup([number_id, title_id, scale_id], temp_group)
+        # Center the caption under the detail
+        full_bbox = Rhino.Geometry.BoundingBox.Empty
+        for entity in entities:
+            full_bbox.Union(entity.GetBoundingBox(True))
+        full_center_x = (full_bbox.Min.X + full_bbox.Max.X) / 2.0
+        full_center_y = (full_bbox.Min.Y + full_bbox.Max.Y) / 2.0
+        caption_height = full_bbox.Max.Y - full_bbox.Min.Y
 
-        full_bbox = rs.BoundingBox([number_id, title_id, scale_id])
-        full_center_x = (full_bbox[0][0] + full_bbox[6][0]) / 2.0
-        full_center_y = (full_bbox[0][1] + full_bbox[6][1]) / 2.0
-        caption_height = full_bbox[6][1] - full_bbox[0][1]
-
-        move_vector = (
+        move_vector = Rhino.Geometry.Vector3d(
             center_x - full_center_x,
             base_y + (caption_height / 2.0) - full_center_y,
             0,
         )
-        rs.MoveObjects([number_id, title_id, scale_id], move_vector)
-
-        rs.DeleteGroup(temp_group)
-
-        # Create final group with metadata
-        group_name = f"DetailCaption_{number}"
-        rs.AddGroup(group_name)
-        rs.AddObjectsToGroup([number_id, title_id, scale_id], group_name)
 
-        # Add metadata to scale text element
-        rs.SetUserText(scale_id, "caption_type", "DetailCaption")
-        rs.SetUserText(scale_id, "linked_detail_id", str(detail_id))
+        # Add each element once, already in place on the caption layer
+        layer_index = sc.doc.Layers.FindByFullPath(Constants.CAPTION_LAYER, -1)
+        if layer_index < 0:
+            raise ValidationError("Caption layer not found", context={"layer": Constants.CAPTION_LAYER})
+
+        # Suppress repaints while the caption is added and grouped, then redraw once
+        with suppress_redraw():
+            caption_ids = []
+            for entity in entities:
+                entity.Translate(move_vector)
+                attributes = Rhino.DocObjects.ObjectAttributes()
+                attributes.LayerIndex = layer_index
+                if entity is scale_te:
+                    # Add metadata to scale text element
+                    attributes.SetUserString("caption_type", "DetailCaption")
+                    attributes.SetUserString("linked_detail_id", str(detail_id))
+                caption_ids.append(sc.doc.Objects.AddText(entity, attributes))
+
+            if System.Guid.Empty in caption_ids:
+                raise ValidationError("Failed to create one or more caption text elements")
+            number_id, title_id, scale_id = caption_ids
+
+            # Create final group in one table call
+            groups = sc.doc.Groups
+            member_ids = System.Collections.Generic.List[System.Guid](caption_ids)
+            if groups.Add(f"DetailCaption_{number}", member_ids) < 0:
+                # Name already taken by another caption; group unnamed rather than merge into its group
+                groups.Add(member_ids)
 
         return (number_id, title_id, scale_id)
@@ -13,12 +13,11 @@ inherit from DocsPluginError and support optional context information for debugg
 
 from __future__ import annotations
 
-from abc import ABC
 from typing import Any
 
 
 # --- Base Exception -------------------------------------------------------
-class DocsPluginError(Exception, ABC):
+class DocsPluginError(Exception):
     """Base exception for all DocsPlease plugin errors.
 
     All plugin exceptions inherit from this class and support optional
@@ -45,11 +45,11 @@ class LayoutTools:
             raise ValidationError("Document views not accessible", context={"project_name": project_name})
 
         count = 0
-        page_views = doc.Views.GetPageViews()
-        for view in page_views or []:
+        key = Metadata.PROJECT_NAME
+        for view in doc.Views.GetPageViews() or []:
             vp = view.ActiveViewport
-            if vp and vp.GetUserString(Metadata.PROJECT_NAME) != project_name:
-                vp.SetUserString(Metadata.PROJECT_NAME, project_name)
+            if vp and vp.GetUserString(key) != project_name:
+                vp.SetUserString(key, project_name)
                 count += 1
         return count
 
@@ -64,11 +64,11 @@ class LayoutTools:
             Set of existing sheet ID strings.
         """
         doc = doc or sc.doc
-        if doc and doc.Views:
-            page_views = doc.Views.GetPageViews()
-            return {
-                v.ActiveViewport.GetUserString(Metadata.SHEET_ID_FULL)
-                for v in page_views or []
-                if v and v.ActiveViewport and v.ActiveViewport.GetUserString(Metadata.SHEET_ID_FULL)
-            }
-        return set()
+        if not (doc and doc.Views):
+            return set()
+
+        # One pass over the pages; each viewport's sheet ID is read once
+        key = Metadata.SHEET_ID_FULL
+        viewports = (view.ActiveViewport for view in doc.Views.GetPageViews() or [] if view)
+        sheet_ids = (vp.GetUserString(key) for vp in viewports if vp)
+        return {sheet_id for sheet_id in sheet_ids if sheet_id}
@@ -23,6 +23,19 @@ from .constants import Constants
 from .exceptions import ProjectConfigError
 
 
+DOCSET_KEY_PREFIX = "project_config_docset_"
+
+
+def _parse_document_set(json_str: str | None) -> dict[str, Any] | None:
+    """Decode a stored document set, returning None for empty or malformed JSON."""
+    if not json_str:
+        return None
+    try:
+        return json.loads(json_str)
+    except (json.JSONDecodeError, ValueError):
+        return None
+
+
 # --- Project Configuration Tools ------------------------------------------
 class ProjectConfigTools:
     """Tools for managing project-level configuration stored at document level."""
@@ -67,16 +80,7 @@ class ProjectConfigTools:
         if not discipline_code:
             return None
 
-        key = f"project_config_docset_{discipline_code}"
-        json_str = rs.GetDocumentUserText(key)
-
-        if not json_str:
-            return None
-
-        try:
-            return json.loads(json_str)
-        except (json.JSONDecodeError, ValueError):
-            return None
+        return _parse_document_set(rs.GetDocumentUserText(f"{DOCSET_KEY_PREFIX}{discipline_code}"))
 
     @staticmethod
     def set_document_set(discipline_code: str, config: dict[str, Any]) -> None:
@@ -92,7 +96,7 @@ class ProjectConfigTools:
         if not discipline_code or not discipline_code.strip():
             raise ProjectConfigError("Discipline code cannot be empty")
 
-        key = f"project_config_docset_{discipline_code}"
+        key = f"{DOCSET_KEY_PREFIX}{discipline_code}"
         json_str = json.dumps(config)
 
         result = rs.SetDocumentUserText(key, json_str)
@@ -117,22 +121,21 @@ class ProjectConfigTools:
             return []
 
         enabled_sets = []
+        strings = sc.doc.Strings
+        prefix_len = len(DOCSET_KEY_PREFIX)
 
         # Iterate through all document strings
-        for i in range(sc.doc.Strings.Count):
-            key = sc.doc.Strings.GetKey(i)
+        for i in range(strings.Count):
+            key = strings.GetKey(i)
 
             # Filter for document set keys
-            if key and key.startswith("project_config_docset_"):
-                # Extract discipline code from key
-                discipline_code = key.replace("project_config_docset_", "")
-
-                # Get and parse configuration
-                config = ProjectConfigTools.get_document_set(discipline_code)
+            if key and key.startswith(DOCSET_KEY_PREFIX):
+                # Parse the value at the same index instead of looking the key up again
+                config = _parse_document_set(strings.GetValue(i))
 
                 # Only include if enabled
                 if config and config.get("enabled", False):
-                    enabled_sets.append((discipline_code, config))
+                    enabled_sets.append((key[prefix_len:], config))
 
         return enabled_sets
 